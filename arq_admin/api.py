@@ -0,0 +1,133 @@
+import hashlib
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from arq.jobs import JobStatus
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.views import View
+
+from arq_admin.connections import connection_manager
+from arq_admin.job import JobCursor, JobInfo
+from arq_admin.queue import Queue
+from arq_admin.settings import ARQ_QUEUES
+from arq_admin.views import AsyncAdminViewMixin
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class JSONEncoder(DjangoJSONEncoder):
+    # args, kwargs and results of jobs can be anything, what JSON doesn't support is represented as a string
+
+    def default(self, o: Any) -> Any:
+        try:
+            return super().default(o)
+        except TypeError:
+            return repr(o)
+
+
+class ApiView(AsyncAdminViewMixin, View):
+    # JSON views for monitoring and scripts, they use the admin's session and permissions
+
+    def handle_no_permission(self, request: HttpRequest) -> HttpResponse:
+        return JsonResponse({'error': 'Staff member required'}, status=403)
+
+    def json_response(self, data: Any, last_modified: Optional[datetime] = None) -> HttpResponse:
+        # responses carry ETag and Last-Modified, so polling clients can get 304 instead of the same data again
+        content = json.dumps(data, cls=JSONEncoder)
+        etag = '"{0}"'.format(hashlib.sha1(content.encode('utf-8')).hexdigest())  # nosec
+        last_modified_timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(self.request, etag=etag, last_modified=last_modified_timestamp)
+        if response is None:
+            response = HttpResponse(content, content_type='application/json')
+
+        response['ETag'] = etag
+        if last_modified_timestamp is not None:
+            response['Last-Modified'] = http_date(last_modified_timestamp)
+
+        return response
+
+
+class QueueListApiView(ApiView):
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        queues_stats = await connection_manager.arun(Queue.gather_stats(ARQ_QUEUES.keys()))
+        return self.json_response({'queues': [asdict(queue_stats) for queue_stats in queues_stats]})
+
+
+class JobListApiView(ApiView):
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        try:
+            status = JobStatus(request.GET['status']) if request.GET.get('status') else None
+            cursor = JobCursor.decode(request.GET['cursor']) if request.GET.get('cursor') else None
+            limit = min(int(request.GET.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        except ValueError as ex:
+            return JsonResponse({'error': str(ex)}, status=400)
+
+        if limit < 1:
+            return JsonResponse({'error': 'Limit must be positive'}, status=400)
+
+        jobs, next_cursor = await connection_manager.arun(self._get_jobs_page(status, cursor, limit))
+        return self.json_response(
+            {'jobs': [job_to_dict(job) for job in jobs], 'next_cursor': next_cursor.encode() if next_cursor else None},
+            last_modified=max(filter(None, [get_last_modified(job) for job in jobs]), default=None),
+        )
+
+    async def _get_jobs_page(
+        self, status: Optional[JobStatus], cursor: Optional[JobCursor], limit: int,
+    ) -> Tuple[List[JobInfo], Optional[JobCursor]]:
+        async with Queue.from_name(self.kwargs['queue_name']) as queue:
+            return await queue.get_jobs_page(status, cursor, limit)
+
+
+class JobDetailApiView(ApiView):
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        job = await connection_manager.arun(self._get_job_info())
+        if job.status == JobStatus.not_found:
+            return JsonResponse({'error': 'Job not found'}, status=404)
+
+        return self.json_response(job_to_dict(job), last_modified=get_last_modified(job))
+
+    async def _get_job_info(self) -> JobInfo:
+        async with Queue.from_name(self.kwargs['queue_name']) as queue:
+            return await queue.get_job_by_id(self.kwargs['job_id'])
+
+
+class JobAbortApiView(ApiView):
+    async def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        # aborted is null when it's not known if the job was aborted
+        return JsonResponse({'aborted': await connection_manager.arun(self._abort_job())})
+
+    async def _abort_job(self) -> Optional[bool]:
+        async with Queue.from_name(self.kwargs['queue_name']) as queue:
+            return await queue.abort_job(self.kwargs['job_id'])
+
+
+def job_to_dict(job: JobInfo) -> Dict[str, Any]:
+    return {
+        'job_id': job.job_id,
+        'function': job.function,
+        'args': job.args,
+        'kwargs': job.kwargs,
+        'job_try': job.job_try,
+        'score': job.score,
+        'status': job.status.value,
+        'enqueue_time': job.enqueue_time,
+        'start_time': job.start_time,
+        'finish_time': job.finish_time,
+        'success': job.success,
+        'result': job.result,
+    }
+
+
+def get_last_modified(job: JobInfo) -> Optional[datetime]:
+    if job.status == JobStatus.not_found:
+        return None
+
+    times: List[Optional[datetime]] = [job.finish_time, job.start_time, job.enqueue_time]
+    return max(time for time in times if time)
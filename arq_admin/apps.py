@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ArqAdminConfig(AppConfig):
     name = 'arq_admin'
     verbose_name = 'ARQ Admin'
+
+    def ready(self) -> None:
+        # connects receivers of the instrumentation signals
+        import arq_admin.metrics  # noqa: F401
@@ -0,0 +1,97 @@
+import asyncio
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional, Set
+from uuid import uuid4
+
+from arq_admin import settings
+from arq_admin.connections import connection_manager
+from arq_admin.queue import Queue
+from arq_admin.results import ADMIN_KEY_PREFIX
+
+BULK_ACTION_KEY_PREFIX = f'{ADMIN_KEY_PREFIX}bulk:'
+# progress of finished actions is kept for a day
+PROGRESS_TTL = 24 * 60 * 60
+
+# references to the running actions, so they are not garbage collected
+_tasks: Set['asyncio.Task[None]'] = set()
+
+
+class BulkAction(str, Enum):
+    abort = 'abort'
+    delete = 'delete'
+
+
+@dataclass
+class BulkActionProgress:
+    action: BulkAction
+    total: int
+    done: int = 0
+    finished: bool = False
+    error: Optional[str] = None
+
+    @property
+    def percent(self) -> int:
+        return 100 * self.done // self.total if self.total else 100
+
+
+async def start_bulk_action(queue_name: str, action: BulkAction, job_ids: List[str]) -> str:
+    # the action runs in the background of the current loop, its progress is stored in Redis
+    # so any process of the admin can show it
+    action_id = uuid4().hex
+    redis = await connection_manager.acquire(settings.ARQ_QUEUES[queue_name])
+    try:
+        await redis.hset(_get_key(action_id), mapping={'action': action.value, 'total': len(job_ids), 'done': 0})
+        await redis.expire(_get_key(action_id), PROGRESS_TTL)
+    finally:
+        await connection_manager.release(redis)
+
+    task = asyncio.ensure_future(_run_bulk_action(queue_name, action_id, action, job_ids))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+    return action_id
+
+
+async def get_progress(queue_name: str, action_id: str) -> Optional[BulkActionProgress]:
+    redis = await connection_manager.acquire(settings.ARQ_QUEUES[queue_name])
+    try:
+        raw_progress = await redis.hgetall(_get_key(action_id))
+    finally:
+        await connection_manager.release(redis)
+
+    if not raw_progress:
+        return None
+
+    progress = {key.decode('utf-8'): value.decode('utf-8') for key, value in raw_progress.items()}
+    return BulkActionProgress(
+        action=BulkAction(progress['action']),
+        total=int(progress['total']),
+        done=int(progress['done']),
+        finished='finished' in progress,
+        error=progress.get('error'),
+    )
+
+
+async def _run_bulk_action(queue_name: str, action_id: str, action: BulkAction, job_ids: List[str]) -> None:
+    key = _get_key(action_id)
+    batch_size = settings.ARQ_BULK_ACTION_BATCH_SIZE
+    async with Queue.from_name(queue_name) as queue:
+        redis = await connection_manager.acquire(queue.redis_settings)
+        try:
+            for i in range(0, len(job_ids), batch_size):
+                batch = job_ids[i:i + batch_size]
+                if action == BulkAction.abort:
+                    await queue.abort_jobs(batch)
+                else:
+                    await queue.delete_jobs(batch)
+                await redis.hincrby(key, 'done', len(batch))
+        except Exception as ex:  # noqa: B902
+            await redis.hset(key, 'error', str(ex))
+        finally:
+            await redis.hset(key, 'finished', 1)
+            await connection_manager.release(redis)
+
+
+def _get_key(action_id: str) -> str:
+    return BULK_ACTION_KEY_PREFIX + action_id
@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from django.core.cache import caches
+from django.utils import timezone
+
+from arq_admin import settings
+
+KEY_PREFIX = 'arq_admin'
+
+
+class LocalCache:
+    # in-process LRU cache with TTL, has the same async interface as Django's caches
+
+    def __init__(self) -> None:
+        self._data: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            expires_at, value = self._data.get(key, (0, default))
+            if expires_at < time.monotonic():
+                self._data.pop(key, None)
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    async def aset(self, key: str, value: Any, timeout: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > settings.ARQ_CACHE_MAX_SIZE:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+local_cache = LocalCache()
+
+
+def is_enabled() -> bool:
+    return bool(settings.ARQ_CACHE_TTL)
+
+
+async def load(queue_name: str, name: str) -> Optional[Tuple[datetime, Any]]:
+    # returns the time the value was cached at along with the value itself
+    if not is_enabled():
+        return None
+
+    return await _get_backend().aget(await _get_key(queue_name, name))
+
+
+async def store(queue_name: str, name: str, value: Any) -> Optional[datetime]:
+    if not is_enabled():
+        return None
+
+    cached_at = timezone.now()
+    await _get_backend().aset(await _get_key(queue_name, name), (cached_at, value), settings.ARQ_CACHE_TTL)
+    return cached_at
+
+
+async def invalidate(queue_name: str) -> None:
+    # values are never deleted one by one, instead all the keys of the queue get a new version
+    if not is_enabled():
+        return
+
+    await _get_backend().aset(_get_version_key(queue_name), time.time_ns(), settings.ARQ_CACHE_TTL)
+
+
+def _get_backend() -> Any:
+    if settings.ARQ_CACHE_ALIAS:
+        return caches[settings.ARQ_CACHE_ALIAS]
+
+    return local_cache
+
+
+def _get_version_key(queue_name: str) -> str:
+    return f'{KEY_PREFIX}:{queue_name}:version'
+
+
+async def _get_key(queue_name: str, name: str) -> str:
+    version = await _get_backend().aget(_get_version_key(queue_name), 0)
+    return f'{KEY_PREFIX}:{queue_name}:{version}:{name}'
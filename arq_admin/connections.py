@@ -0,0 +1,148 @@
+import asyncio
+import atexit
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import (
+    Any, AsyncGenerator, AsyncIterator, Awaitable, Coroutine, Dict, Generator,
+    Optional, TypeVar,
+)
+
+from arq import ArqRedis
+from arq.connections import RedisSettings, create_pool
+
+from arq_admin import settings
+from arq_admin.instrumentation import bind_profile, instrument_redis
+
+T = TypeVar('T')
+
+
+@dataclass
+class PooledRedis:
+    redis: ArqRedis
+    checked_at: float
+
+
+class ConnectionManager:
+    # Redis pools are bound to the event loop they were created in, so instead of creating a new loop
+    # with a new pool for every request, all the admin's Redis work runs in one long-lived loop in a daemon thread
+    # and pools are kept alive there between requests
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._pools: Dict[str, PooledRedis] = {}
+        self._pool_locks: Dict[str, asyncio.Lock] = {}
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='arq-admin', daemon=True)
+                self._thread.start()
+
+        return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(bind_profile(coro), self.loop).result()
+
+    async def arun(self, coro: Coroutine[Any, Any, T]) -> T:
+        # awaits the coroutine running in the admin's loop without blocking the current one
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(bind_profile(coro), self.loop))
+
+    def iterate(self, agen: AsyncGenerator[T, None]) -> Generator[T, None, None]:
+        # drives an async generator in the admin's loop from sync code, e.g. a streaming response under WSGI
+        try:
+            while True:
+                try:
+                    yield self.run(self._await(agen.__anext__()))
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run(self._await(agen.aclose()))
+
+    async def aiterate(self, agen: AsyncGenerator[T, None]) -> AsyncIterator[T]:
+        try:
+            while True:
+                try:
+                    yield await self.arun(self._await(agen.__anext__()))
+                except StopAsyncIteration:
+                    return
+        finally:
+            await self.arun(self._await(agen.aclose()))
+
+    async def acquire(self, redis_settings: RedisSettings) -> ArqRedis:
+        # pools can be shared only inside the admin's loop, anywhere else a short-lived pool is created
+        if asyncio.get_running_loop() is not self._loop:
+            return await self._create_pool(redis_settings)
+
+        key = repr(redis_settings)
+        async with self._pool_locks.setdefault(key, asyncio.Lock()):
+            pooled_redis = self._pools.get(key)
+            if pooled_redis and not await self._is_healthy(pooled_redis):
+                del self._pools[key]
+                await self._close_redis(pooled_redis.redis)
+                pooled_redis = None
+
+            if not pooled_redis:
+                pooled_redis = PooledRedis(redis=await self._create_pool(redis_settings), checked_at=time.monotonic())
+                self._pools[key] = pooled_redis
+
+            return pooled_redis.redis
+
+    async def release(self, redis: ArqRedis) -> None:
+        if not any(pooled_redis.redis is redis for pooled_redis in self._pools.values()):
+            await redis.close()
+
+    def close(self) -> None:
+        with self._thread_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is None or thread is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._close_pools(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    @staticmethod
+    async def _await(awaitable: Awaitable[T]) -> T:
+        # run_coroutine_threadsafe() accepts coroutines only
+        return await awaitable
+
+    @staticmethod
+    async def _is_healthy(pooled_redis: PooledRedis) -> bool:
+        if time.monotonic() - pooled_redis.checked_at < settings.ARQ_POOL_HEALTH_CHECK_INTERVAL:
+            return True
+
+        try:
+            await pooled_redis.redis.ping()
+        except Exception:  # noqa: B902
+            return False
+
+        pooled_redis.checked_at = time.monotonic()
+        return True
+
+    @staticmethod
+    async def _close_redis(redis: ArqRedis) -> None:
+        with suppress(Exception):
+            await redis.close()
+
+    async def _create_pool(self, redis_settings: RedisSettings) -> ArqRedis:
+        redis = await create_pool(redis_settings)
+        instrument_redis(redis)
+        return redis
+
+    async def _close_pools(self) -> None:
+        pools, self._pools, self._pool_locks = self._pools, {}, {}
+        for pooled_redis in pools.values():
+            await self._close_redis(pooled_redis.redis)
+
+
+connection_manager = ConnectionManager()
+atexit.register(connection_manager.close)
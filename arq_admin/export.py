@@ -0,0 +1,76 @@
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncGenerator, Dict, Optional
+
+from arq.jobs import JobStatus
+
+from arq_admin import settings
+from arq_admin.job import JobFilter, JobInfo
+from arq_admin.queue import Queue
+
+EXPORT_FIELDS = (
+    'job_id', 'function', 'args', 'kwargs', 'status', 'job_try', 'enqueue_time', 'start_time', 'finish_time',
+    'success', 'result',
+)
+
+
+class ExportFormat(str, Enum):
+    csv = 'csv'
+    ndjson = 'ndjson'
+
+    @property
+    def content_type(self) -> str:
+        return 'text/csv' if self == ExportFormat.csv else 'application/x-ndjson'
+
+
+async def export_jobs(
+    queue_name: str, export_format: ExportFormat, status: Optional[JobStatus], job_filter: JobFilter,
+) -> AsyncGenerator[str, None]:
+    # rows are yielded in chunks of a batch, so the export starts right away and its memory usage stays constant
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, EXPORT_FIELDS)
+    if export_format == ExportFormat.csv:
+        writer.writeheader()
+
+    rows_in_buffer = 0
+    async with Queue.from_name(queue_name) as queue:
+        async for job in queue.iter_jobs(status, job_filter):
+            row = job_to_row(job)
+            if export_format == ExportFormat.csv:
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(row, default=repr) + '\n')
+
+            rows_in_buffer += 1
+            if rows_in_buffer >= settings.ARQ_JOBS_BATCH_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                rows_in_buffer = 0
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def job_to_row(job: JobInfo) -> Dict[str, Any]:
+    finished = job.status == JobStatus.complete
+    return {
+        'job_id': job.job_id,
+        'function': job.function,
+        'args': job.args,
+        'kwargs': job.kwargs,
+        'status': job.status.value,
+        'job_try': job.job_try,
+        'enqueue_time': _format_time(job.enqueue_time),
+        'start_time': _format_time(job.start_time),
+        'finish_time': _format_time(job.finish_time),
+        'success': job.success if finished else None,
+        'result': repr(job.result)[:settings.ARQ_EXPORT_RESULT_MAX_LENGTH] if finished else None,
+    }
+
+
+def _format_time(time: Optional[datetime]) -> Optional[str]:
+    return time.isoformat() if time else None
@@ -0,0 +1,46 @@
+from typing import Any, Dict, List
+
+from django import forms
+
+from arq_admin.bulk import BulkAction
+from arq_admin.job import JobFilter
+
+
+class JobIdsField(forms.Field):
+    widget = forms.MultipleHiddenInput
+
+    def to_python(self, value: Any) -> List[str]:
+        return list(value or [])
+
+
+class JobFilterForm(forms.Form):
+    function = forms.CharField(required=False)
+    enqueued_after = forms.DateTimeField(required=False, widget=forms.DateTimeInput(attrs={'type': 'datetime-local'}))
+    enqueued_before = forms.DateTimeField(required=False, widget=forms.DateTimeInput(attrs={'type': 'datetime-local'}))
+    min_job_try = forms.IntegerField(required=False, min_value=1)
+    success = forms.NullBooleanField(
+        required=False,
+        widget=forms.Select(choices=[('', 'Any result'), ('true', 'Succeeded'), ('false', 'Failed')]),
+    )
+
+    def get_job_filter(self) -> JobFilter:
+        if not self.is_valid():
+            return JobFilter()
+
+        return JobFilter(**{name: value if value != '' else None for name, value in self.cleaned_data.items()})
+
+
+class BulkActionForm(forms.Form):
+    action = forms.ChoiceField(choices=[
+        (BulkAction.abort.value, 'Abort selected jobs'),
+        (BulkAction.delete.value, 'Delete selected jobs'),
+    ])
+    job_ids = JobIdsField(required=False)
+    select_all = forms.BooleanField(required=False)
+
+    def clean(self) -> Dict[str, Any]:
+        cleaned_data = super().clean()
+        if not cleaned_data.get('job_ids') and not cleaned_data.get('select_all'):
+            raise forms.ValidationError('No jobs are selected')
+
+        return cleaned_data
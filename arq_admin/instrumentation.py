@@ -0,0 +1,152 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Coroutine, Iterator, List, Optional, Tuple, TypeVar
+
+from arq import ArqRedis
+from django.dispatch import Signal
+
+T = TypeVar('T')
+
+# sent after every Redis command or pipeline of the admin with command, duration, bytes_sent and bytes_received
+redis_command_executed = Signal()
+# sent after a batch of jobs is fetched with queue_name, jobs and deserialization_duration
+jobs_hydrated = Signal()
+
+
+@dataclass
+class Profile:
+    # what the admin did in Redis while handling one request
+    redis_commands: 'Counter[str]' = field(default_factory=Counter)
+    redis_duration: float = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    jobs_hydrated: int = 0
+    deserialization_duration: float = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def most_common_redis_commands(self) -> List[Tuple[str, int]]:
+        return self.redis_commands.most_common()
+
+    @property
+    def redis_commands_count(self) -> int:
+        return sum(self.redis_commands.values())
+
+    @property
+    def duration(self) -> float:
+        return time.perf_counter() - self.started_at
+
+
+_current_profile: ContextVar[Optional[Profile]] = ContextVar('arq_admin_profile', default=None)
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    current_profile = Profile()
+    token = _current_profile.set(current_profile)
+    try:
+        yield current_profile
+    finally:
+        _current_profile.reset(token)
+
+
+def bind_profile(coro: Coroutine[Any, Any, T]) -> Coroutine[Any, Any, T]:
+    # the coroutine will record into the current profile even if it's run in another loop
+    current_profile = _current_profile.get()
+    if current_profile is None:
+        return coro
+
+    return _run_with_profile(current_profile, coro)
+
+
+def is_enabled() -> bool:
+    # measuring sizes of commands isn't free, so it's done only when someone is interested
+    return _current_profile.get() is not None or bool(redis_command_executed.receivers)
+
+
+def record_redis_command(command: str, duration: float, bytes_sent: int, bytes_received: int) -> None:
+    current_profile = _current_profile.get()
+    if current_profile is not None:
+        current_profile.redis_commands[command] += 1
+        current_profile.redis_duration += duration
+        current_profile.bytes_sent += bytes_sent
+        current_profile.bytes_received += bytes_received
+
+    redis_command_executed.send(
+        sender=ArqRedis, command=command, duration=duration, bytes_sent=bytes_sent, bytes_received=bytes_received,
+    )
+
+
+def record_jobs_hydrated(queue_name: str, jobs: int, deserialization_duration: float) -> None:
+    current_profile = _current_profile.get()
+    if current_profile is not None:
+        current_profile.jobs_hydrated += jobs
+        current_profile.deserialization_duration += deserialization_duration
+
+    jobs_hydrated.send(
+        sender=ArqRedis, queue_name=queue_name, jobs=jobs, deserialization_duration=deserialization_duration,
+    )
+
+
+def instrument_redis(redis: ArqRedis) -> None:
+    # wraps the client, so every command and pipeline it sends is recorded
+    execute_command = redis.execute_command
+    pipeline = redis.pipeline
+
+    async def instrumented_execute_command(*args: Any, **options: Any) -> Any:
+        if not is_enabled():
+            return await execute_command(*args, **options)
+
+        started_at = time.perf_counter()
+        response = None
+        try:
+            response = await execute_command(*args, **options)
+            return response
+        finally:
+            record_redis_command(
+                str(args[0]).upper(), time.perf_counter() - started_at, _get_size(args), _get_size(response),
+            )
+
+    def instrumented_pipeline(*args: Any, **kwargs: Any) -> Any:
+        pipe = pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        async def instrumented_execute(*execute_args: Any, **execute_kwargs: Any) -> Any:
+            if not is_enabled():
+                return await execute(*execute_args, **execute_kwargs)
+
+            bytes_sent = sum(_get_size(command_args) for command_args, _options in pipe.command_stack)
+            started_at = time.perf_counter()
+            response = None
+            try:
+                response = await execute(*execute_args, **execute_kwargs)
+                return response
+            finally:
+                record_redis_command('PIPELINE', time.perf_counter() - started_at, bytes_sent, _get_size(response))
+
+        setattr(pipe, 'execute', instrumented_execute)  # noqa: B010
+        return pipe
+
+    setattr(redis, 'execute_command', instrumented_execute_command)  # noqa: B010
+    setattr(redis, 'pipeline', instrumented_pipeline)  # noqa: B010
+
+
+async def _run_with_profile(current_profile: Profile, coro: Coroutine[Any, Any, T]) -> T:
+    _current_profile.set(current_profile)
+    return await coro
+
+
+def _get_size(value: Any) -> int:
+    # approximate size of a command or a response on the wire
+    if isinstance(value, (bytes, str)):
+        return len(value)
+    if isinstance(value, (list, tuple, set)):
+        return sum(_get_size(item) for item in value)
+    if isinstance(value, dict):
+        return sum(_get_size(key) + _get_size(item) for key, item in value.items())
+    if value is None:
+        return 0
+    return len(str(value))
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import base64
+import json
+from dataclasses import astuple, dataclass
 from datetime import datetime
 from typing import Any, Optional, Union
 
@@ -36,3 +38,100 @@ class JobInfo(JobDef):
             })
 
         return cls(**kwargs)  # type: ignore
+
+
+@dataclass
+class JobSummary:
+    # a row of a job list, args, kwargs and results may be huge and aren't kept for lists
+    __slots__ = ('job_id', 'function', 'status', 'job_try', 'enqueue_time', 'start_time', 'finish_time', 'success')
+
+    job_id: str
+    function: str
+    status: JobStatus
+    job_try: Optional[int]
+    enqueue_time: datetime
+    start_time: Optional[datetime]
+    finish_time: Optional[datetime]
+    success: bool
+
+    @classmethod
+    def from_info(cls, job: JobInfo) -> 'JobSummary':
+        return cls(
+            job_id=job.job_id,
+            function=job.function,
+            status=job.status,
+            job_try=job.job_try,
+            enqueue_time=job.enqueue_time,
+            start_time=job.start_time,
+            finish_time=job.finish_time,
+            success=job.success,
+        )
+
+
+@dataclass
+class Preview:
+    text: str
+    length: int
+
+    @property
+    def is_truncated(self) -> bool:
+        return len(self.text) < self.length
+
+    @classmethod
+    def from_value(cls, value: Any, max_length: int) -> 'Preview':
+        text = str(value)
+        return cls(text=text[:max_length], length=len(text))
+
+
+@dataclass
+class JobFilter:
+    function: Optional[str] = None
+    enqueued_after: Optional[datetime] = None
+    enqueued_before: Optional[datetime] = None
+    min_job_try: Optional[int] = None
+    # applies to finished jobs only
+    success: Optional[bool] = None
+
+    def __bool__(self) -> bool:
+        return any(value is not None for value in astuple(self))
+
+    @property
+    def min_score(self) -> Optional[int]:
+        # a job is never scheduled before it's enqueued, so its score can't be less than its enqueue time
+        if self.enqueued_after is None:
+            return None
+
+        return int(self.enqueued_after.timestamp() * 1000)
+
+    def matches(self, job: Union[JobInfo, JobSummary]) -> bool:  # noqa: CFQ004
+        if self.function is not None and job.function != self.function:
+            return False
+        if self.enqueued_after is not None and job.enqueue_time < self.enqueued_after:
+            return False
+        if self.enqueued_before is not None and job.enqueue_time >= self.enqueued_before:
+            return False
+        if self.min_job_try is not None and (job.job_try or 0) < self.min_job_try:
+            return False
+        if self.success is not None and (job.status != JobStatus.complete or job.success != self.success):
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class JobCursor:
+    # position after the last job of a page: jobs of the queue are walked first, then finished jobs
+    phase: int
+    score: float
+    job_id: str
+
+    @classmethod
+    def decode(cls, token: str) -> 'JobCursor':
+        try:
+            phase, score, job_id = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+            return cls(phase=int(phase), score=float(score), job_id=str(job_id))
+        except (TypeError, ValueError) as ex:
+            raise ValueError(f'Invalid cursor: {token}') from ex
+
+    def encode(self) -> str:
+        raw_cursor = json.dumps([self.phase, self.score, self.job_id]).encode('utf-8')
+        return base64.urlsafe_b64encode(raw_cursor).decode('ascii')
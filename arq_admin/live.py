@@ -0,0 +1,129 @@
+import asyncio
+import json
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Set
+
+from arq.utils import timestamp_ms
+from django.core.serializers.json import DjangoJSONEncoder
+
+from arq_admin import settings
+from arq_admin.queue import Queue
+
+KEEPALIVE = ': keepalive\n\n'
+
+
+@dataclass
+class Event:
+    name: str
+    data: Dict[str, Any]
+
+    def render(self) -> str:
+        # Server-Sent Events format
+        return f'event: {self.name}\ndata: {json.dumps(self.data, cls=DjangoJSONEncoder)}\n\n'
+
+
+@dataclass
+class QueuePoller:
+    # polls one queue for all the people watching it, so the load on Redis doesn't depend on how many they are.
+    # Lives in the connection manager's loop like everything else that touches Redis
+    queue_name: str
+    subscribers: Set['asyncio.Queue[Event]'] = field(default_factory=set)
+    stats: Dict[str, Any] = field(default_factory=dict)
+    running_job_ids: Optional[Set[str]] = None
+    finished_after: Optional[float] = None
+    task: Optional['asyncio.Task[None]'] = None
+
+    def subscribe(self, subscriber: 'asyncio.Queue[Event]') -> None:
+        self.subscribers.add(subscriber)
+        # a new subscriber needs the whole picture, not only what's changed since the previous poll
+        if self.stats:
+            subscriber.put_nowait(Event('stats', {'queue': self.queue_name, 'changes': self.stats}))
+        if self.task is None:
+            self.task = asyncio.ensure_future(self._run())
+
+    def unsubscribe(self, subscriber: 'asyncio.Queue[Event]') -> None:
+        self.subscribers.discard(subscriber)
+        if not self.subscribers and self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def poll(self) -> List[Event]:
+        events = []
+        stats_changes = await self._get_stats_changes()
+        if stats_changes:
+            events.append(Event('stats', {'queue': self.queue_name, 'changes': stats_changes}))
+
+        async with Queue.from_name(self.queue_name) as queue:
+            started_job_ids = await self._get_started_job_ids(queue)
+            finished_jobs = await self._get_finished_jobs(queue)
+        if started_job_ids or finished_jobs:
+            events.append(Event('jobs', {
+                'queue': self.queue_name, 'started': started_job_ids, 'finished': finished_jobs,
+            }))
+
+        return events
+
+    async def _run(self) -> None:
+        while True:
+            with suppress(Exception):
+                for event in await self.poll():
+                    for subscriber in self.subscribers:
+                        subscriber.put_nowait(event)
+
+            await asyncio.sleep(settings.ARQ_LIVE_POLL_INTERVAL)
+
+    async def _get_stats_changes(self) -> Dict[str, Any]:
+        queue_stats = (await Queue.gather_stats([self.queue_name]))[0]
+        stats = asdict(queue_stats)
+        stats.pop('data_as_of')
+        changes = {name: value for name, value in stats.items() if name not in self.stats or self.stats[name] != value}
+        self.stats = stats
+        return changes
+
+    async def _get_started_job_ids(self, queue: Queue) -> List[str]:
+        running_job_ids = await queue.get_running_job_ids()
+        # jobs running before the first poll aren't news
+        previous_running_job_ids = self.running_job_ids if self.running_job_ids is not None else set(running_job_ids)
+        self.running_job_ids = set(running_job_ids)
+        return [job_id for job_id in running_job_ids if job_id not in previous_running_job_ids]
+
+    async def _get_finished_jobs(self, queue: Queue) -> List[Dict[str, Any]]:
+        if self.finished_after is None:
+            # jobs finished before the first poll aren't news either
+            self.finished_after = timestamp_ms()
+            return []
+
+        # a burst of finished jobs is reported over several polls
+        finished_jobs = await queue.get_jobs_finished_after(self.finished_after, settings.ARQ_LIVE_MAX_JOBS_PER_POLL)
+        if finished_jobs:
+            self.finished_after = finished_jobs[-1][1]
+
+        return [{'job_id': job_id, 'success': success} for job_id, _finished_at, success in finished_jobs]
+
+
+# pollers are created and dropped in the connection manager's loop only, so they need no locking
+_pollers: Dict[str, QueuePoller] = {}
+
+
+async def subscribe(queue_names: Iterable[str]) -> AsyncGenerator[str, None]:
+    # events of the queues rendered for a Server-Sent Events response
+    subscriber: 'asyncio.Queue[Event]' = asyncio.Queue()
+    pollers = [_pollers.setdefault(queue_name, QueuePoller(queue_name)) for queue_name in queue_names]
+    for poller in pollers:
+        poller.subscribe(subscriber)
+
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(subscriber.get(), settings.ARQ_LIVE_KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                # lets proxies know the connection is alive
+                yield KEEPALIVE
+            else:
+                yield event.render()
+    finally:
+        for poller in pollers:
+            poller.unsubscribe(subscriber)
+            if not poller.subscribers:
+                _pollers.pop(poller.queue_name, None)
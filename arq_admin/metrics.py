@@ -0,0 +1,143 @@
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from typing import (
+    Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple,
+)
+
+from django.dispatch import receiver
+from django.utils import timezone
+
+from arq_admin import settings
+from arq_admin.instrumentation import redis_command_executed
+from arq_admin.queue import Queue, QueueStats
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Histogram:
+    # a minimal Prometheus histogram with one label, the admin doesn't need the whole client library
+
+    def __init__(self, name: str, documentation: str, label: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label = label
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # per label value: counts of observations per bucket, sum and count of all the observations
+        self._values: Dict[str, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, label_value: str) -> None:
+        with self._lock:
+            bucket_counts, total, count = self._values.get(label_value, ([0] * len(self.buckets), 0.0, 0))
+            index = bisect_left(self.buckets, value)
+            if index < len(bucket_counts):
+                bucket_counts[index] += 1
+            self._values[label_value] = (bucket_counts, total + value, count + 1)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            values = sorted(
+                (label_value, (list(bucket_counts), total, count))
+                for label_value, (bucket_counts, total, count) in self._values.items()
+            )
+
+        for label_value, (bucket_counts, total, count) in values:
+            labels = f'{self.label}="{_escape(label_value)}"'
+            cumulative_count = 0
+            for bucket, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative_count += bucket_count
+                lines.append(f'{self.name}_bucket{{{labels},le="{bucket}"}} {cumulative_count}')
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'{self.name}_sum{{{labels}}} {total}')
+            lines.append(f'{self.name}_count{{{labels}}} {count}')
+
+        return lines
+
+
+redis_command_duration = Histogram(
+    'arq_admin_redis_command_duration_seconds', "Duration of the admin's own Redis commands", 'command',
+)
+
+
+class StatsCache:
+    # stats of the queues are gathered at most once in ARQ_METRICS_CACHE_TTL seconds however often they're scraped
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._gathered_at = 0.0
+        self._stats: List[QueueStats] = []
+
+    async def get(self, queue_names: Iterable[str]) -> List[QueueStats]:
+        with self._lock:
+            if time.monotonic() - self._gathered_at < settings.ARQ_METRICS_CACHE_TTL:
+                return self._stats
+
+        stats = await Queue.gather_stats(queue_names)
+        with self._lock:
+            self._stats, self._gathered_at = stats, time.monotonic()
+
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._gathered_at = 0.0
+            self._stats = []
+
+
+stats_cache = StatsCache()
+
+
+@receiver(redis_command_executed)
+def observe_redis_command(command: str, duration: float, **kwargs: Any) -> None:
+    redis_command_duration.observe(duration, command)
+
+
+QUEUE_GAUGES: List[Tuple[str, str, Callable[[QueueStats, datetime], Optional[float]]]] = [
+    ('arq_queue_up', 'Whether stats of the queue could be collected', lambda stats, now: 0 if stats.error else 1),
+    ('arq_queue_queued_jobs', 'Jobs waiting for a worker', lambda stats, now: stats.queued_jobs),
+    ('arq_queue_running_jobs', 'Jobs being run by workers', lambda stats, now: stats.running_jobs),
+    ('arq_queue_deferred_jobs', 'Jobs deferred to the future', lambda stats, now: stats.deferred_jobs),
+    (
+        'arq_queue_results_stored', 'Results stored in the Redis instance of the queue',
+        lambda stats, now: stats.results_stored,
+    ),
+    (
+        'arq_queue_oldest_queued_job_age_seconds', 'How long the oldest queued job has been waiting for a worker',
+        lambda stats, now: _get_oldest_queued_job_age(stats, now),
+    ),
+]
+
+
+async def render_metrics(queue_names: Iterable[str]) -> str:
+    # Prometheus text format
+    queues_stats = await stats_cache.get(queue_names)
+    now = timezone.now()
+
+    lines: List[str] = []
+    for name, documentation, get_value in QUEUE_GAUGES:
+        lines.extend([f'# HELP {name} {documentation}', f'# TYPE {name} gauge'])
+        for stats in queues_stats:
+            value = get_value(stats, now)
+            if value is not None:
+                lines.append(f'{name}{{queue="{_escape(stats.name)}"}} {value}')
+
+    lines.extend(redis_command_duration.render())
+    return '\n'.join(lines) + '\n'
+
+
+def _get_oldest_queued_job_age(stats: QueueStats, now: datetime) -> Optional[float]:
+    if stats.error:
+        return None
+
+    return (now - stats.oldest_queued_job_at).total_seconds() if stats.oldest_queued_job_at else 0
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
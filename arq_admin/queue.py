@@ -1,22 +1,43 @@
 import asyncio
+import hashlib
 import re
+import time
 from contextlib import suppress
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import (
+    Any, AsyncGenerator, Awaitable, Callable, Dict, Iterable, List, Optional,
+    Tuple, TypeVar,
+)
 
 from arq import ArqRedis
-from arq.connections import RedisSettings, create_pool
-from arq.jobs import DeserializationError, Job as ArqJob, JobDef, JobStatus
-from arq.utils import timestamp_ms
+from arq.connections import RedisSettings
+from arq.constants import (
+    abort_jobs_ss, in_progress_key_prefix, job_key_prefix, result_key_prefix,
+    retry_key_prefix,
+)
+from arq.jobs import (
+    DeserializationError, Job as ArqJob, JobDef, JobStatus, deserialize_job,
+    deserialize_result,
+)
+from arq.utils import ms_to_datetime, timestamp_ms
 from django.utils import timezone
+from redis.exceptions import ResponseError
 
-from arq_admin import settings
+from arq_admin import cache, instrumentation, scripts, settings
 from arq_admin.compat import ARQ_VERSION_TUPLE
-from arq_admin.job import JobInfo
+from arq_admin.connections import connection_manager
+from arq_admin.job import JobCursor, JobFilter, JobInfo, JobSummary
+from arq_admin.results import ResultIndex
+
+T = TypeVar('T')
 
 ARQ_PREFIX = 'arq:'
 ARQ_KEY_REGEX = re.compile(r'arq\:(?P<prefix>.+?)\:(?P<job_id>.+)')
 PREFIX_PRIORITY = {prefix: i for i, prefix in enumerate(['job', 'in-progress', 'result'])}
+# cursors walk jobs of the queue ordered by score first, then finished jobs from the most recent
+QUEUE_PHASE = 0
+RESULTS_PHASE = 1
 
 
 @dataclass
@@ -29,8 +50,14 @@ class QueueStats:
     queued_jobs: Optional[int] = None
     running_jobs: Optional[int] = None
     deferred_jobs: Optional[int] = None
+    # results aren't bound to a queue, so these are results of all the queues in the Redis instance
+    results_stored: Optional[int] = None
+    # when the job waiting for a worker the longest became ready to run
+    oldest_queued_job_at: Optional[datetime] = None
 
     error: Optional[str] = None
+    # set only when the stats come from the cache
+    data_as_of: Optional[datetime] = field(default=None, compare=False)
 
 
 @dataclass
@@ -40,53 +67,152 @@ class Queue:
     concurrent_redis_access_sem: asyncio.Semaphore = field(
         default_factory=lambda: asyncio.Semaphore(settings.ARQ_MAX_CONNECTIONS),
     )
+    # queues living in the same Redis instance can share keyspace scans through this mapping
+    shared_scans: Dict[str, 'asyncio.Future[Any]'] = field(default_factory=dict)
     _cached_job_id_to_status_map: Optional[Dict[str, JobStatus]] = None
+    _cached_job_id_to_score_map: Optional[Dict[str, float]] = None
     _redis: ArqRedis = field(init=False, default=None)  # type: ignore
+    # the oldest time of the cached data the queue has used, None if nothing came from the cache
+    data_as_of: Optional[datetime] = field(init=False, default=None)
 
     async def __aenter__(self) -> 'Queue':
-        self._redis = await create_pool(self.redis_settings)
+        self._redis = await connection_manager.acquire(self.redis_settings)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        await self._redis.close()
+        await connection_manager.release(self._redis)
 
     @classmethod
-    def from_name(cls, name: str) -> 'Queue':
+    def from_name(cls, name: str, **kwargs: Any) -> 'Queue':
         return cls(
             name=name,
             redis_settings=settings.ARQ_QUEUES[name],
+            **kwargs,
         )
 
+    @classmethod
+    async def gather_stats(cls, queue_names: Iterable[str]) -> List[QueueStats]:
+        # stats for all the queues are collected concurrently, so a slow or unreachable Redis doesn't hold up the rest
+        shared_scans: Dict[str, 'asyncio.Future[Any]'] = {}
+        queues = [cls.from_name(name, shared_scans=shared_scans) for name in queue_names]
+        return await asyncio.gather(*[queue._get_stats_with_timeout() for queue in queues])
+
     async def get_jobs(self, status: Optional[JobStatus] = None) -> List[JobInfo]:
+        return await self.get_jobs_by_ids(await self.get_job_ids(status))
+
+    async def get_job_ids(
+        self, status: Optional[JobStatus] = None, job_filter: Optional[JobFilter] = None,
+    ) -> List[str]:
+        # cheap way to order jobs without fetching them: by their score in the queue,
+        # jobs that are not in the queue anymore (i.e. finished ones) go first
         job_id_to_status_map = await self._get_job_id_to_status_map()
+        job_id_to_score_map = self._cached_job_id_to_score_map or {}
 
-        if status:
-            job_ids = {job_id for (job_id, job_status) in job_id_to_status_map.items() if job_status == status}
-        else:
-            job_ids = set(job_id_to_status_map.keys())
+        job_ids = {
+            job_id for (job_id, job_status) in job_id_to_status_map.items()
+            if status is None or job_status == status
+        }
+        # the scores map comes from ZRANGE and is already ordered, only jobs without a score need sorting
+        job_ids_without_score = sorted(job_id for job_id in job_ids if job_id not in job_id_to_score_map)
+        ordered_job_ids = job_ids_without_score + [job_id for job_id in job_id_to_score_map if job_id in job_ids]
 
-        jobs: List[JobInfo] = await asyncio.gather(*[self.get_job_by_id(job_id) for job_id in job_ids])
+        if not job_filter:
+            return ordered_job_ids
 
-        return jobs
+        min_score = job_filter.min_score
+        if min_score is not None:
+            ordered_job_ids = [
+                job_id for job_id in ordered_job_ids if job_id_to_score_map.get(job_id, min_score) >= min_score
+            ]
 
-    async def get_stats(self) -> QueueStats:
-        result = QueueStats(
-            name=self.name,
-            host=str(self.redis_settings.host),
-            port=self.redis_settings.port,
-            database=self.redis_settings.database,
+        return await self._filter_job_ids(ordered_job_ids, job_filter)
+
+    async def get_finished_job_ids(self, failed: bool = False, job_filter: Optional[JobFilter] = None) -> List[str]:
+        # ordered by finish time, the most recent first
+        job_ids = await self._get_result_index().get_job_ids(failed=failed)
+        if not job_filter:
+            return job_ids
+
+        return await self._filter_job_ids(job_ids, job_filter)
+
+    async def get_running_job_ids(self) -> List[str]:
+        # workers pick jobs with the lowest scores, so running jobs are looked for among the oldest ready ones
+        oldest_job_ids = await self._redis.zrangebyscore(
+            self.name, '-inf', timestamp_ms(), start=0, num=settings.ARQ_RUNNING_JOBS_COUNT_LIMIT,
         )
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for job_id in oldest_job_ids:
+                pipe.exists(in_progress_key_prefix + job_id.decode('utf-8'))
+            in_progress_markers = await pipe.execute()
+
+        return [
+            job_id.decode('utf-8') for job_id, in_progress in zip(oldest_job_ids, in_progress_markers) if in_progress
+        ]
+
+    async def get_jobs_finished_after(self, finished_after: float, limit: int) -> List[Tuple[str, float, bool]]:
+        return await self._get_result_index().get_finished_after(finished_after, limit)
+
+    async def iter_jobs(
+        self, status: Optional[JobStatus] = None, job_filter: Optional[JobFilter] = None,
+    ) -> AsyncGenerator[JobInfo, None]:
+        # walks the queue and the finished jobs batch by batch in constant memory, but the order is arbitrary
+        async for job_ids in self._iter_job_id_batches(status):
+            for job in await self._get_jobs_batch(job_ids):
+                if (status is None or job.status == status) and (not job_filter or job_filter.matches(job)):
+                    yield job
+
+    async def get_jobs_page(
+        self, status: Optional[JobStatus] = None, cursor: Optional[JobCursor] = None, limit: int = 100,
+    ) -> Tuple[List[JobInfo], Optional[JobCursor]]:
+        # unlike offsets, cursors stay valid while jobs come and go and every page costs the same.
+        # Pages of a status may have less jobs than the limit, the walk is over only when there's no next cursor.
+        phase = cursor.phase if cursor else QUEUE_PHASE
+        job_ids: List[str] = []
+        next_cursor = None
+
+        if phase == QUEUE_PHASE and status != JobStatus.complete:
+            min_score, max_score = self._get_score_range(status)
+            page = await self._get_sorted_set_page(self.name, cursor, limit, min_score, max_score)
+            job_ids.extend(job_id for job_id, _score in page)
+            if len(page) == limit:
+                next_cursor = JobCursor(phase=QUEUE_PHASE, score=page[-1][1], job_id=page[-1][0])
+            cursor = None
+
+        remaining = limit - len(job_ids)
+        if next_cursor is None and remaining and status in (None, JobStatus.complete):
+            result_index = self._get_result_index()
+            await result_index.refresh()
+            page = await self._get_sorted_set_page(result_index.results_key, cursor, remaining, reverse=True)
+            job_ids.extend(job_id for job_id, _score in page)
+            if len(page) == remaining:
+                next_cursor = JobCursor(phase=RESULTS_PHASE, score=page[-1][1], job_id=page[-1][0])
+
+        jobs = await self.get_jobs_by_ids(job_ids)
+        return [job for job in jobs if status is None or job.status == status], next_cursor
+
+    async def get_jobs_by_ids(self, job_ids: List[str]) -> List[JobInfo]:
+        return await self._get_batches_cached('jobs', job_ids, self._get_jobs_batch)
+
+    async def get_job_summaries_by_ids(self, job_ids: List[str]) -> List[JobSummary]:
+        # for job lists, payloads of the jobs are dropped right after they're deserialized
+        return await self._get_batches_cached('summaries', job_ids, self._get_job_summaries_batch)
+
+    async def get_stats(self) -> QueueStats:
+        cached_result: Optional[QueueStats] = await self._load_cached('stats')
+        if cached_result is not None:
+            return replace(cached_result, data_as_of=self.data_as_of)
+
+        result = self._get_empty_stats()
 
         try:
-            job_id_to_status_map = await self._get_job_id_to_status_map()
+            counters = await self._count_jobs()
+            ready_jobs, result.deferred_jobs, result.running_jobs, result.oldest_queued_job_at = counters
+            result.results_stored = await self._share_between_queues('results', self._count_results)
         except Exception as ex:  # noqa: B902
             result.error = str(ex)
         else:
-            statuses = job_id_to_status_map.values()
-
-            result.queued_jobs = len([status for status in statuses if status == JobStatus.queued])
-            result.running_jobs = len([status for status in statuses if status == JobStatus.in_progress])
-            result.deferred_jobs = len([status for status in statuses if status == JobStatus.deferred])
+            result.queued_jobs = ready_jobs - result.running_jobs
+            await cache.store(self.name, 'stats', result)
 
         return result
 
@@ -107,19 +233,7 @@ class Queue:
                 unknown_function_msg = "Unknown, can't deserialize"
 
         if not base_info:
-            parameters = {
-                'function': unknown_function_msg,
-                'args': (),
-                'kwargs': {},
-                'job_try': -1,
-                'enqueue_time': timezone.now().replace(year=2077),
-                'score': 420,
-            }
-            if ARQ_VERSION_TUPLE < (0, 26, 0):
-                base_info = JobDef(**parameters)
-            else:
-                parameters['job_id'] = job_id
-                base_info = JobDef(**parameters)
+            base_info = self._get_unknown_job_def(job_id, unknown_function_msg)
 
         job_info = JobInfo.from_base(base_info, job_id)
         job_info.status = await self._get_job_status(job_id)
@@ -134,10 +248,297 @@ class Queue:
             _queue_name=self.name,
             _deserializer=settings.ARQ_DESERIALIZER_BY_QUEUE.get(self.name),
         )
+        aborted = None
         with suppress(asyncio.TimeoutError):
-            return await arq_job.abort(timeout=settings.ARQ_JOB_ABORT_TIMEOUT)
+            aborted = await arq_job.abort(timeout=settings.ARQ_JOB_ABORT_TIMEOUT)
+
+        await cache.invalidate(self.name)
+        return aborted
+
+    async def abort_jobs(self, job_ids: List[str]) -> None:
+        # the same as ArqJob.abort(), but for many jobs at once and without waiting for workers to abort them
+        if not job_ids:
+            return
+
+        now = timestamp_ms()
+        await self._redis.zadd(abort_jobs_ss, {job_id: now for job_id in job_ids})
+        await cache.invalidate(self.name)
+
+    async def delete_jobs(self, job_ids: List[str]) -> None:
+        # running jobs are deleted too, but their workers will still finish them and store the results
+        if not job_ids:
+            return
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zrem(self.name, *job_ids)
+            pipe.delete(*[
+                prefix + job_id
+                for job_id in job_ids
+                for prefix in (job_key_prefix, retry_key_prefix, result_key_prefix)
+            ])
+            await pipe.execute()
+
+        await cache.invalidate(self.name)
+
+    @staticmethod
+    def _get_unknown_job_def(job_id: str, unknown_function_msg: str) -> JobDef:
+        parameters = {
+            'function': unknown_function_msg,
+            'args': (),
+            'kwargs': {},
+            'job_try': -1,
+            'enqueue_time': timezone.now().replace(year=2077),
+            'score': 420,
+        }
+        if ARQ_VERSION_TUPLE < (0, 26, 0):
+            return JobDef(**parameters)
+
+        parameters['job_id'] = job_id
+        return JobDef(**parameters)
+
+    @staticmethod
+    def _get_job_status_from_markers(
+        raw_result: Optional[bytes], in_progress_marker: Optional[bytes], zscore: Optional[float],
+    ) -> JobStatus:
+        # same logic as ArqJob.status() uses
+        if raw_result:
+            return JobStatus.complete
+        if in_progress_marker:
+            return JobStatus.in_progress
+        if zscore:
+            return JobStatus.deferred if zscore > timestamp_ms() else JobStatus.queued
+        return JobStatus.not_found
+
+    @staticmethod
+    def _get_score_range(status: Optional[JobStatus]) -> Tuple[float, float]:
+        now = timestamp_ms()
+        if status == JobStatus.deferred:
+            return now + 1, float('inf')
+        if status in (JobStatus.queued, JobStatus.in_progress):
+            return float('-inf'), now
+        return float('-inf'), float('inf')
+
+    def _get_empty_stats(self) -> QueueStats:
+        return QueueStats(
+            name=self.name,
+            host=str(self.redis_settings.host),
+            port=self.redis_settings.port,
+            database=self.redis_settings.database,
+        )
 
-        return None
+    async def _get_stats_with_timeout(self) -> QueueStats:
+        try:
+            return await asyncio.wait_for(self._connect_and_get_stats(), settings.ARQ_QUEUE_STATS_TIMEOUT)
+        except asyncio.TimeoutError:
+            error = f'Timed out after {settings.ARQ_QUEUE_STATS_TIMEOUT} seconds'
+        except Exception as ex:  # noqa: B902
+            error = str(ex)
+
+        result = self._get_empty_stats()
+        result.error = error
+        return result
+
+    async def _connect_and_get_stats(self) -> QueueStats:
+        async with self:
+            return await self.get_stats()
+
+    async def _load_cached(self, name: str) -> Any:
+        cached = await cache.load(self.name, name)
+        if cached is None:
+            return None
+
+        cached_at, value = cached
+        self.data_as_of = min(self.data_as_of or cached_at, cached_at)
+        return value
+
+    def _get_result_index(self) -> ResultIndex:
+        return ResultIndex(
+            redis=self._redis, queue_name=self.name, deserializer=settings.ARQ_DESERIALIZER_BY_QUEUE.get(self.name),
+        )
+
+    async def _iter_job_id_batches(self, status: Optional[JobStatus]) -> AsyncGenerator[List[str], None]:
+        job_ids = []
+        async for job_id in self._scan_job_ids(status):
+            job_ids.append(job_id)
+            if len(job_ids) >= settings.ARQ_JOBS_BATCH_SIZE:
+                yield job_ids
+                job_ids = []
+
+        if job_ids:
+            yield job_ids
+
+    async def _scan_job_ids(self, status: Optional[JobStatus]) -> AsyncGenerator[str, None]:
+        # jobs in the queue come from ZSCAN, finished ones from the result index
+        if status != JobStatus.complete:
+            async for job_id, _score in self._redis.zscan_iter(self.name, count=settings.ARQ_SCAN_COUNT):
+                yield job_id.decode('utf-8')
+
+        if status in (None, JobStatus.complete):
+            async for job_id in self._get_result_index().scan_job_ids():
+                yield job_id
+
+    async def _get_sorted_set_page(
+        self,
+        key: str,
+        cursor: Optional[JobCursor],
+        limit: int,
+        min_score: float = float('-inf'),
+        max_score: float = float('inf'),
+        reverse: bool = False,
+    ) -> List[Tuple[str, float]]:
+        # members with the same score are ordered by id, so the ones up to the cursor's id are skipped
+        ties = 0
+        if cursor:
+            ties = await self._redis.zcount(key, cursor.score, cursor.score)
+            if reverse:
+                max_score = min(max_score, cursor.score)
+            else:
+                min_score = max(min_score, cursor.score)
+
+        if reverse:
+            page = await self._redis.zrevrangebyscore(
+                key, max_score, min_score, start=0, num=limit + ties, withscores=True,
+            )
+        else:
+            page = await self._redis.zrangebyscore(
+                key, min_score, max_score, start=0, num=limit + ties, withscores=True,
+            )
+
+        items = [(job_id.decode('utf-8'), score) for job_id, score in page]
+        if cursor:
+            items = [
+                (job_id, score) for job_id, score in items
+                if score != cursor.score or (job_id < cursor.job_id if reverse else job_id > cursor.job_id)
+            ]
+
+        return items[:limit]
+
+    async def _get_batches_cached(
+        self, name: str, job_ids: List[str], get_batch: Callable[[List[str]], Awaitable[List[T]]],
+    ) -> List[T]:
+        cache_name = f'{name}:' + hashlib.sha1('\n'.join(job_ids).encode('utf-8')).hexdigest()  # nosec
+        cached_items: Optional[List[T]] = await self._load_cached(cache_name)
+        if cached_items is not None:
+            return cached_items
+
+        batch_size = settings.ARQ_JOBS_BATCH_SIZE
+        batches: List[List[T]] = await asyncio.gather(*[
+            get_batch(job_ids[i:i + batch_size]) for i in range(0, len(job_ids), batch_size)
+        ])
+        items = [item for batch in batches for item in batch]
+
+        await cache.store(self.name, cache_name, items)
+        return items
+
+    async def _filter_job_ids(self, job_ids: List[str], job_filter: JobFilter) -> List[str]:
+        # jobs are fetched batch by batch and only ids of the matching ones are kept, so memory usage stays bounded
+        batch_size = settings.ARQ_JOBS_BATCH_SIZE
+        filtered_job_ids: List[str] = []
+        for i in range(0, len(job_ids), batch_size):
+            jobs = await self._get_job_summaries_batch(job_ids[i:i + batch_size])
+            filtered_job_ids.extend(job.job_id for job in jobs if job_filter.matches(job))
+
+        return filtered_job_ids
+
+    async def _get_jobs_batch(self, job_ids: List[str]) -> List[JobInfo]:
+        # the same data ArqJob.info() and ArqJob.status() fetch, but for the whole batch in one round trip
+        async with self.concurrent_redis_access_sem:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.mget([job_key_prefix + job_id for job_id in job_ids])
+                pipe.mget([result_key_prefix + job_id for job_id in job_ids])
+                pipe.mget([in_progress_key_prefix + job_id for job_id in job_ids])
+                for job_id in job_ids:
+                    pipe.zscore(self.name, job_id)
+                raw_jobs, raw_results, in_progress_markers, *scores = await pipe.execute()
+
+        started_at = time.perf_counter()
+        jobs = []
+        for job_id, raw_job, raw_result, in_progress_marker, score in zip(
+            job_ids, raw_jobs, raw_results, in_progress_markers, scores,
+        ):
+            job_info = JobInfo.from_base(self._deserialize_job(job_id, raw_job, raw_result, score), job_id)
+            if self._cached_job_id_to_status_map is not None:
+                job_info.status = self._cached_job_id_to_status_map.get(job_id, JobStatus.not_found)
+            else:
+                job_info.status = self._get_job_status_from_markers(raw_result, in_progress_marker, score)
+            jobs.append(job_info)
+
+        instrumentation.record_jobs_hydrated(self.name, len(jobs), time.perf_counter() - started_at)
+        return jobs
+
+    async def _get_job_summaries_batch(self, job_ids: List[str]) -> List[JobSummary]:
+        return [JobSummary.from_info(job) for job in await self._get_jobs_batch(job_ids)]
+
+    def _deserialize_job(
+        self, job_id: str, raw_job: Optional[bytes], raw_result: Optional[bytes], score: Optional[float],
+    ) -> JobDef:
+        deserializer = settings.ARQ_DESERIALIZER_BY_QUEUE.get(self.name)
+        unknown_function_msg = "Can't find job"
+        base_info: Optional[JobDef] = None
+        try:
+            if raw_result:
+                base_info = deserialize_result(raw_result, deserializer=deserializer)
+            elif raw_job:
+                base_info = deserialize_job(raw_job, deserializer=deserializer)
+        except DeserializationError:
+            unknown_function_msg = "Unknown, can't deserialize"
+
+        if not base_info:
+            return self._get_unknown_job_def(job_id, unknown_function_msg)
+
+        base_info.score = None if score is None else int(score)
+        return base_info
+
+    async def _count_jobs(self) -> Tuple[int, int, int, Optional[datetime]]:
+        # counters for the queue without touching the jobs themselves, costs the same regardless of the queue size
+        if settings.ARQ_USE_SCRIPTS:
+            # scripting may be disabled, e.g. on managed Redis
+            with suppress(ResponseError):
+                return await self._count_jobs_with_script()
+
+        now = timestamp_ms()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zcount(self.name, '-inf', now)
+            pipe.zcount(self.name, f'({now}', '+inf')
+            # workers pick jobs with the lowest scores, so running jobs are looked for among the oldest ready ones
+            pipe.zrangebyscore(
+                self.name, '-inf', now, start=0, num=settings.ARQ_RUNNING_JOBS_COUNT_LIMIT, withscores=True,
+            )
+            ready_jobs, deferred_jobs, oldest_jobs = await pipe.execute()
+
+        if not oldest_jobs:
+            return ready_jobs, deferred_jobs, 0, None
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for job_id, _score in oldest_jobs:
+                pipe.exists(in_progress_key_prefix + job_id.decode('utf-8'))
+            in_progress_markers = await pipe.execute()
+
+        # the oldest queued job is the first one that isn't running yet
+        oldest_queued_job_score = next(
+            (score for (_job_id, score), in_progress in zip(oldest_jobs, in_progress_markers) if not in_progress), None,
+        )
+        oldest_queued_job_at = (
+            ms_to_datetime(int(oldest_queued_job_score)) if oldest_queued_job_score is not None else None
+        )
+        return ready_jobs, deferred_jobs, sum(in_progress_markers), oldest_queued_job_at
+
+    async def _count_jobs_with_script(self) -> Tuple[int, int, int, Optional[datetime]]:
+        ready_jobs, deferred_jobs, running_jobs, oldest_queued_job_score = await scripts.count_jobs(
+            self._redis, self.name, settings.ARQ_RUNNING_JOBS_COUNT_LIMIT,
+        )
+        oldest_queued_job_at = (
+            ms_to_datetime(int(oldest_queued_job_score)) if oldest_queued_job_score is not None else None
+        )
+        return ready_jobs, deferred_jobs, running_jobs, oldest_queued_job_at
+
+    async def _count_results(self) -> int:
+        # results aren't indexed by arq, so they can be counted only by walking the keyspace
+        match = f'{result_key_prefix}*'
+        if not settings.ARQ_USE_SCAN:
+            return len(await self._redis.keys(match))
+
+        return len([key async for key in self._redis.scan_iter(match=match, count=settings.ARQ_SCAN_COUNT)])
 
     async def _get_job_status(self, job_id: str) -> JobStatus:
         if self._cached_job_id_to_status_map is not None:
@@ -156,6 +557,97 @@ class Queue:
         if self._cached_job_id_to_status_map is not None:
             return self._cached_job_id_to_status_map
 
+        cached_maps = await self._load_cached('status_map')
+        if cached_maps is not None:
+            self._cached_job_id_to_status_map, self._cached_job_id_to_score_map = cached_maps
+            return self._cached_job_id_to_status_map
+
+        job_ids_to_statuses: Optional[Dict[str, JobStatus]] = None
+        if settings.ARQ_USE_SCRIPTS:
+            # scripting may be disabled, e.g. on managed Redis
+            with suppress(ResponseError):
+                job_ids_to_scores, job_ids_to_statuses = await self._classify_jobs_with_script()
+
+        if job_ids_to_statuses is None:
+            job_ids_to_scores, job_ids_to_prefixes = await self._get_job_ids_to_prefixes()
+            job_ids_to_statuses = {
+                job_id: self._get_job_status_from_raw_data(prefix, job_ids_to_scores.get(job_id))
+                for job_id, prefix in job_ids_to_prefixes.items()
+            }
+
+        self._cached_job_id_to_score_map = job_ids_to_scores
+        self._cached_job_id_to_status_map = job_ids_to_statuses
+        await cache.store(self.name, 'status_map', (self._cached_job_id_to_status_map, job_ids_to_scores))
+
+        return self._cached_job_id_to_status_map
+
+    async def _get_job_ids_to_prefixes(self) -> Tuple[Dict[str, float], Dict[str, str]]:
+        if not settings.ARQ_USE_SCAN:
+            return await self._get_job_ids_to_prefixes_with_keys()
+
+        job_ids_with_scores = await self._redis.zrange(self.name, withscores=True, start=0, end=-1)
+        job_ids_to_scores = {key[0].decode('utf-8'): key[1] for key in job_ids_with_scores}
+        job_ids_to_prefixes = {
+            job_id: prefix for job_id, prefix in (
+                await self._share_between_queues('job_ids_to_prefixes', self._scan_job_ids_to_prefixes)
+            ).items()
+            # filter out stuff that's not a client job
+            if job_id in job_ids_to_scores or prefix == 'result'
+        }
+        return job_ids_to_scores, job_ids_to_prefixes
+
+    async def _classify_jobs_with_script(self) -> Tuple[Dict[str, float], Dict[str, JobStatus]]:
+        # jobs of the queue are classified inside Redis, so only their ids, scores and a character per job come back.
+        # It's done batch by batch, so a huge queue doesn't block Redis for long
+        job_ids_to_scores: Dict[str, float] = {}
+        job_ids_to_statuses: Dict[str, JobStatus] = {}
+        batch_size = settings.ARQ_SCAN_COUNT
+        start = 0
+        while True:
+            jobs = await scripts.classify_jobs(self._redis, self.name, start, start + batch_size - 1)
+            for job_id, score, status in jobs:
+                job_ids_to_scores[job_id] = score
+                if status is not None:
+                    job_ids_to_statuses[job_id] = status
+            if len(jobs) < batch_size:
+                break
+            start += batch_size
+
+        # finished jobs not in the queue anymore can be found only by their result keys
+        for job_id in await self._share_between_queues('result_job_ids', self._get_result_job_ids):
+            job_ids_to_statuses[job_id] = JobStatus.complete
+
+        return job_ids_to_scores, job_ids_to_statuses
+
+    async def _get_result_job_ids(self) -> List[str]:
+        match = f'{result_key_prefix}*'
+        if settings.ARQ_USE_SCAN:
+            keys = [key async for key in self._redis.scan_iter(match=match, count=settings.ARQ_SCAN_COUNT)]
+        else:
+            keys = await self._redis.keys(match)
+
+        return [key.decode('utf-8')[len(result_key_prefix):] for key in keys]
+
+    async def _share_between_queues(self, scan_name: str, scan: Callable[[], Awaitable[T]]) -> T:
+        key = f'{scan_name}:{self.redis_settings!r}'
+        if key not in self.shared_scans:
+            self.shared_scans[key] = asyncio.ensure_future(scan())
+
+        # one queue giving up on the scan mustn't cancel it for the others
+        return await asyncio.shield(self.shared_scans[key])
+
+    async def _scan_job_ids_to_prefixes(self) -> Dict[str, str]:
+        job_ids_to_prefixes: Dict[str, str] = {}
+        # PREFIX_PRIORITY is ordered from the less specific prefix to the more specific one,
+        # so keys found by the later scans override the earlier ones
+        for prefix in PREFIX_PRIORITY:
+            key_prefix = f'{ARQ_PREFIX}{prefix}:'
+            async for key in self._redis.scan_iter(match=f'{key_prefix}*', count=settings.ARQ_SCAN_COUNT):
+                job_ids_to_prefixes[key.decode('utf-8')[len(key_prefix):]] = prefix
+
+        return job_ids_to_prefixes
+
+    async def _get_job_ids_to_prefixes_with_keys(self) -> Tuple[Dict[str, float], Dict[str, str]]:
         async with self._redis.pipeline(transaction=True) as pipe:
             await pipe.keys(f'{ARQ_PREFIX}*:*')
             await pipe.zrange(self.name, withscores=True, start=0, end=-1)
@@ -182,14 +674,9 @@ class Queue:
             key=lambda job_id_with_prefix: PREFIX_PRIORITY[job_id_with_prefix[-1]],
         ))
 
-        self._cached_job_id_to_status_map = {
-            job_id: self._get_job_status_from_raw_data(prefix, job_ids_to_scores.get(job_id))
-            for job_id, prefix in job_ids_to_prefixes.items()
-        }
-
-        return self._cached_job_id_to_status_map
+        return job_ids_to_scores, job_ids_to_prefixes
 
-    def _get_job_status_from_raw_data(self, prefix: str, zscore: Optional[int]) -> JobStatus:  # noqa: CFQ004
+    def _get_job_status_from_raw_data(self, prefix: str, zscore: Optional[float]) -> JobStatus:  # noqa: CFQ004
         if prefix == 'result':
             return JobStatus.complete
         if prefix == 'in-progress' and zscore:
@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from typing import AsyncGenerator, List, Optional, Tuple
+
+from arq import ArqRedis
+from arq.constants import result_key_prefix
+from arq.jobs import DeserializationError, Deserializer, deserialize_result
+
+from arq_admin import settings
+
+ADMIN_KEY_PREFIX = 'arq:admin:'
+# all the indexed results of the Redis instance, lets the index know which results it has seen already
+ALL_RESULTS_KEY = f'{ADMIN_KEY_PREFIX}results'
+QUEUE_RESULTS_KEY_PREFIX = f'{ADMIN_KEY_PREFIX}results:'
+QUEUE_FAILED_KEY_PREFIX = f'{ADMIN_KEY_PREFIX}failed:'
+REFRESH_LOCK_KEY_PREFIX = f'{ADMIN_KEY_PREFIX}results-refresh:'
+
+
+@dataclass
+class ResultIndex:
+    # arq doesn't index results, so the admin lazily maintains sorted sets of finished jobs' ids scored by
+    # their finish time. Only results that appeared since the previous refresh are fetched and deserialized.
+    redis: ArqRedis
+    queue_name: str
+    deserializer: Optional[Deserializer] = None
+
+    @property
+    def results_key(self) -> str:
+        return QUEUE_RESULTS_KEY_PREFIX + self.queue_name
+
+    @property
+    def failed_key(self) -> str:
+        return QUEUE_FAILED_KEY_PREFIX + self.queue_name
+
+    async def get_job_ids(self, failed: bool = False) -> List[str]:
+        # the most recently finished jobs go first
+        await self.refresh()
+        job_ids = await self.redis.zrevrange(self.failed_key if failed else self.results_key, 0, -1)
+        return [job_id.decode('utf-8') for job_id in job_ids]
+
+    async def scan_job_ids(self, failed: bool = False) -> AsyncGenerator[str, None]:
+        # unordered, but doesn't load all the ids at once
+        await self.refresh()
+        key = self.failed_key if failed else self.results_key
+        async for job_id, _score in self.redis.zscan_iter(key, count=settings.ARQ_SCAN_COUNT):
+            yield job_id.decode('utf-8')
+
+    async def get_finished_after(self, finished_after: float, limit: int) -> List[Tuple[str, float, bool]]:
+        # ids, finish times in ms and success of the jobs finished after the given time, the oldest first
+        await self.refresh()
+        finished_jobs = await self.redis.zrangebyscore(
+            self.results_key, f'({finished_after}', '+inf', start=0, num=limit, withscores=True,
+        )
+        if not finished_jobs:
+            return []
+
+        last_finished_at = finished_jobs[-1][1]
+        failed_job_ids = set(await self.redis.zrangebyscore(self.failed_key, f'({finished_after}', last_finished_at))
+        return [
+            (job_id.decode('utf-8'), score, job_id not in failed_job_ids) for job_id, score in finished_jobs
+        ]
+
+    async def refresh(self) -> None:
+        lock_key = REFRESH_LOCK_KEY_PREFIX + self.queue_name
+        if not await self.redis.set(lock_key, 1, nx=True, ex=settings.ARQ_RESULT_INDEX_REFRESH_INTERVAL):
+            return
+
+        async for job_ids in self._scan_result_job_ids():
+            await self._index(job_ids)
+
+        for key in (ALL_RESULTS_KEY, self.results_key, self.failed_key):
+            await self._prune(key)
+
+    async def _scan_result_job_ids(self) -> AsyncGenerator[List[str], None]:
+        job_ids = []
+        async for key in self.redis.scan_iter(match=f'{result_key_prefix}*', count=settings.ARQ_SCAN_COUNT):
+            job_ids.append(key.decode('utf-8')[len(result_key_prefix):])
+            if len(job_ids) >= settings.ARQ_JOBS_BATCH_SIZE:
+                yield job_ids
+                job_ids = []
+
+        if job_ids:
+            yield job_ids
+
+    async def _index(self, job_ids: List[str]) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.zscore(ALL_RESULTS_KEY, job_id)
+            scores = await pipe.execute()
+
+        new_job_ids = [job_id for job_id, score in zip(job_ids, scores) if score is None]
+        if not new_job_ids:
+            return
+
+        raw_results = await self.redis.mget([result_key_prefix + job_id for job_id in new_job_ids])
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id, raw_result in zip(new_job_ids, raw_results):
+                if raw_result is None:
+                    # expired after the scan
+                    continue
+
+                try:
+                    result = deserialize_result(raw_result, deserializer=self.deserializer)
+                except DeserializationError:
+                    # probably a result of another queue with a different serializer, don't try it again
+                    pipe.zadd(ALL_RESULTS_KEY, {job_id: 0})
+                    continue
+
+                finish_time_ms = int(result.finish_time.timestamp() * 1000)
+                pipe.zadd(ALL_RESULTS_KEY, {job_id: finish_time_ms})
+                pipe.zadd(QUEUE_RESULTS_KEY_PREFIX + result.queue_name, {job_id: finish_time_ms})
+                if not result.success:
+                    pipe.zadd(QUEUE_FAILED_KEY_PREFIX + result.queue_name, {job_id: finish_time_ms})
+
+            await pipe.execute()
+
+    async def _prune(self, key: str) -> None:
+        # removes jobs whose results have expired
+        job_ids = []
+        async for job_id, _score in self.redis.zscan_iter(key, count=settings.ARQ_SCAN_COUNT):
+            job_ids.append(job_id)
+            if len(job_ids) >= settings.ARQ_JOBS_BATCH_SIZE:
+                await self._remove_expired(key, job_ids)
+                job_ids = []
+
+        if job_ids:
+            await self._remove_expired(key, job_ids)
+
+    async def _remove_expired(self, key: str, job_ids: List[bytes]) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.exists(result_key_prefix.encode('utf-8') + job_id)
+            exists = await pipe.execute()
+
+        expired_job_ids = [job_id for job_id, job_exists in zip(job_ids, exists) if not job_exists]
+        if expired_job_ids:
+            await self.redis.zrem(key, *expired_job_ids)
@@ -0,0 +1,80 @@
+from typing import List, Optional, Tuple
+
+from arq import ArqRedis
+from arq.constants import (
+    in_progress_key_prefix, job_key_prefix, result_key_prefix,
+)
+from arq.jobs import JobStatus
+from arq.utils import timestamp_ms
+
+# one character per job, so a batch of statuses is a short string
+STATUS_CODES = {
+    'q': JobStatus.queued,
+    'd': JobStatus.deferred,
+    'r': JobStatus.in_progress,
+    'c': JobStatus.complete,
+    # none of the job's keys exist
+    'n': None,
+}
+
+# KEYS: the queue; ARGV: start and stop of the batch, now in ms, prefixes of job, in-progress and result keys.
+# The same classification as the one done in Python from the key names
+CLASSIFY_JOBS = '''
+local jobs = redis.call('ZRANGE', KEYS[1], ARGV[1], ARGV[2], 'WITHSCORES')
+local codes = {}
+for i = 1, #jobs, 2 do
+    local job_id = jobs[i]
+    local code = 'n'
+    if redis.call('EXISTS', ARGV[6] .. job_id) == 1 then
+        code = 'c'
+    elseif redis.call('EXISTS', ARGV[5] .. job_id) == 1 then
+        code = 'r'
+    elseif redis.call('EXISTS', ARGV[4] .. job_id) == 1 then
+        code = tonumber(jobs[i + 1]) > tonumber(ARGV[3]) and 'd' or 'q'
+    end
+    codes[#codes + 1] = code
+end
+return {jobs, table.concat(codes)}
+'''
+
+# KEYS: the queue; ARGV: now in ms, how many of the oldest ready jobs are checked for running ones,
+# prefix of in-progress keys. Returns counts of ready, deferred and running jobs and the score of the oldest queued job
+COUNT_JOBS = '''
+local ready = redis.call('ZCOUNT', KEYS[1], '-inf', ARGV[1])
+local deferred = redis.call('ZCOUNT', KEYS[1], '(' .. ARGV[1], '+inf')
+local oldest_jobs = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'WITHSCORES', 'LIMIT', 0, ARGV[2])
+local running = 0
+local oldest_queued_job_score = false
+for i = 1, #oldest_jobs, 2 do
+    if redis.call('EXISTS', ARGV[3] .. oldest_jobs[i]) == 1 then
+        running = running + 1
+    elseif not oldest_queued_job_score then
+        oldest_queued_job_score = oldest_jobs[i + 1]
+    end
+end
+return {ready, deferred, running, oldest_queued_job_score}
+'''
+
+
+async def classify_jobs(
+    redis: ArqRedis, queue_name: str, start: int, stop: int,
+) -> List[Tuple[str, float, Optional[JobStatus]]]:
+    # jobs of the queue between the positions with their scores and statuses
+    script = redis.register_script(CLASSIFY_JOBS)
+    args = [start, stop, timestamp_ms(), job_key_prefix, in_progress_key_prefix, result_key_prefix]
+    jobs, codes = await script(keys=[queue_name], args=args)
+    return [
+        (job_id.decode('utf-8'), float(score), STATUS_CODES[code])
+        for job_id, score, code in zip(jobs[::2], jobs[1::2], codes.decode('ascii'))
+    ]
+
+
+async def count_jobs(redis: ArqRedis, queue_name: str, limit: int) -> Tuple[int, int, int, Optional[float]]:
+    script = redis.register_script(COUNT_JOBS)
+    ready_jobs, deferred_jobs, running_jobs, oldest_queued_job_score = await script(
+        keys=[queue_name], args=[timestamp_ms(), limit, in_progress_key_prefix],
+    )
+    # false of Lua is nil in the reply
+    if oldest_queued_job_score is not None:
+        oldest_queued_job_score = float(oldest_queued_job_score)
+    return ready_jobs, deferred_jobs, running_jobs, oldest_queued_job_score
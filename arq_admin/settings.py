@@ -28,3 +28,56 @@ if ARQ_DESERIALIZER:
 ARQ_JOB_ABORT_TIMEOUT = getattr(settings, 'ARQ_JOB_ABORT_TIMEOUT', 5)
 
 ARQ_MAX_CONNECTIONS = getattr(settings, 'ARQ_MAX_CONNECTIONS', 100)
+
+# SCAN walks the keyspace incrementally, set to False to use a single blocking KEYS command instead
+ARQ_USE_SCAN = getattr(settings, 'ARQ_USE_SCAN', True)
+ARQ_SCAN_COUNT = getattr(settings, 'ARQ_SCAN_COUNT', 1000)
+
+# statuses and counters of jobs are computed by Lua scripts inside Redis, so less data is sent to the admin.
+# The admin falls back to computing them itself if scripting is disabled on the server
+ARQ_USE_SCRIPTS = getattr(settings, 'ARQ_USE_SCRIPTS', False)
+
+# how many jobs are fetched from Redis in one round trip
+ARQ_JOBS_BATCH_SIZE = getattr(settings, 'ARQ_JOBS_BATCH_SIZE', 100)
+
+# Redis pools are reused between requests and pinged if they haven't been used for this amount of seconds
+ARQ_POOL_HEALTH_CHECK_INTERVAL = getattr(settings, 'ARQ_POOL_HEALTH_CHECK_INTERVAL', 30)
+
+# a queue taking longer than this amount of seconds is shown with an error on the queues page
+ARQ_QUEUE_STATS_TIMEOUT = getattr(settings, 'ARQ_QUEUE_STATS_TIMEOUT', 10)
+
+# running jobs are counted among this amount of the oldest jobs in the queue
+ARQ_RUNNING_JOBS_COUNT_LIMIT = getattr(settings, 'ARQ_RUNNING_JOBS_COUNT_LIMIT', 1000)
+
+# queue stats, status maps and pages of jobs are cached for this amount of seconds, 0 disables caching
+ARQ_CACHE_TTL = getattr(settings, 'ARQ_CACHE_TTL', 0)
+# alias of a Django cache to use, by default the data is cached in the memory of the process
+ARQ_CACHE_ALIAS = getattr(settings, 'ARQ_CACHE_ALIAS', None)
+ARQ_CACHE_MAX_SIZE = getattr(settings, 'ARQ_CACHE_MAX_SIZE', 1000)
+
+# finished jobs are indexed by the admin in Redis, new results are indexed at most once in this amount of seconds
+ARQ_RESULT_INDEX_REFRESH_INTERVAL = getattr(settings, 'ARQ_RESULT_INDEX_REFRESH_INTERVAL', 10)
+
+# how many jobs are aborted or deleted in one round trip by bulk actions
+ARQ_BULK_ACTION_BATCH_SIZE = getattr(settings, 'ARQ_BULK_ACTION_BATCH_SIZE', 1000)
+
+# results of jobs are truncated to this amount of characters in exports
+ARQ_EXPORT_RESULT_MAX_LENGTH = getattr(settings, 'ARQ_EXPORT_RESULT_MAX_LENGTH', 1000)
+
+# args, kwargs and results of jobs are truncated to this amount of characters on the job's page
+ARQ_PREVIEW_MAX_LENGTH = getattr(settings, 'ARQ_PREVIEW_MAX_LENGTH', 10000)
+
+# metrics are collected at most once in this amount of seconds however often they're scraped
+ARQ_METRICS_CACHE_TTL = getattr(settings, 'ARQ_METRICS_CACHE_TTL', 30)
+# metrics can be scraped with this token in the Authorization header instead of logging in as a staff member
+ARQ_METRICS_TOKEN = getattr(settings, 'ARQ_METRICS_TOKEN', None)
+
+# the live dashboard polls every queue once in this amount of seconds however many people are watching it
+ARQ_LIVE_POLL_INTERVAL = getattr(settings, 'ARQ_LIVE_POLL_INTERVAL', 2)
+# a comment is sent to idle dashboards once in this amount of seconds, so proxies don't close the connection
+ARQ_LIVE_KEEPALIVE_INTERVAL = getattr(settings, 'ARQ_LIVE_KEEPALIVE_INTERVAL', 15)
+# finished jobs reported to dashboards per poll, the rest are reported by the next polls
+ARQ_LIVE_MAX_JOBS_PER_POLL = getattr(settings, 'ARQ_LIVE_MAX_JOBS_PER_POLL', 100)
+
+# shows what the admin did in Redis while rendering the page at its bottom
+ARQ_DEBUG_FOOTER = getattr(settings, 'ARQ_DEBUG_FOOTER', False)
@@ -1,17 +1,33 @@
 from django.urls import path
 
+from arq_admin.api import (
+    JobAbortApiView, JobDetailApiView, JobListApiView, QueueListApiView,
+)
 from arq_admin.views import (
-    AllJobListView, DeferredJobListView, JobAbortView, JobDetailView,
-    QueuedJobListView, QueueListView, RunningJobListView,
+    AllJobListView, BulkActionView, CompleteJobListView, DeferredJobListView,
+    FailedJobListView, JobAbortView, JobDetailView, JobExportView,
+    LiveDashboardView, LiveEventsView, MetricsView, QueuedJobListView,
+    QueueListView, RunningJobListView,
 )
 
 app_name = 'arq_admin'
 urlpatterns = [
     path('', QueueListView.as_view(), name='home'),
+    path('metrics', MetricsView.as_view(), name='metrics'),
+    path('live/', LiveDashboardView.as_view(), name='live'),
+    path('live/events', LiveEventsView.as_view(), name='live_events'),
     path('queue/<str:queue_name>/', AllJobListView.as_view(), name='all_jobs'),
     path('queue/<str:queue_name>/queued/', QueuedJobListView.as_view(), name='queued_jobs'),
     path('queue/<str:queue_name>/running/', RunningJobListView.as_view(), name='running_jobs'),
     path('queue/<str:queue_name>/deferred/', DeferredJobListView.as_view(), name='deferred_jobs'),
+    path('queue/<str:queue_name>/complete/', CompleteJobListView.as_view(), name='complete_jobs'),
+    path('queue/<str:queue_name>/failed/', FailedJobListView.as_view(), name='failed_jobs'),
+    path('queue/<str:queue_name>/export.<str:export_format>', JobExportView.as_view(), name='export_jobs'),
+    path('queue/<str:queue_name>/bulk/<str:action_id>/', BulkActionView.as_view(), name='bulk_action'),
     path('queue/<str:queue_name>/<str:job_id>/', JobDetailView.as_view(), name='job_detail'),
     path('queue/<str:queue_name>/<str:job_id>/abort', JobAbortView.as_view(), name='job_abort'),
+    path('api/queues/', QueueListApiView.as_view(), name='api_queues'),
+    path('api/queues/<str:queue_name>/jobs/', JobListApiView.as_view(), name='api_jobs'),
+    path('api/queues/<str:queue_name>/jobs/<str:job_id>/', JobDetailApiView.as_view(), name='api_job_detail'),
+    path('api/queues/<str:queue_name>/jobs/<str:job_id>/abort/', JobAbortApiView.as_view(), name='api_job_abort'),
 ]
@@ -1,49 +1,94 @@
-import asyncio
-from operator import attrgetter
-from typing import Any, Dict, List, Optional
+import hmac
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from arq.jobs import JobStatus
+from asgiref.sync import sync_to_async
 from django.contrib import admin, messages
-from django.contrib.admin.views.decorators import staff_member_required
-from django.http import HttpRequest, HttpResponse
+from django.contrib.auth import REDIRECT_FIELD_NAME
+from django.contrib.auth.views import redirect_to_login
+from django.core.handlers.asgi import ASGIRequest
+from django.http import (
+    Http404, HttpRequest, HttpResponse, HttpResponseForbidden,
+    StreamingHttpResponse,
+)
 from django.shortcuts import redirect
-from django.utils.decorators import method_decorator
-from django.views.generic import DetailView, ListView
-
-from arq_admin.job import JobInfo
+from django.template.response import TemplateResponse
+from django.urls import reverse
+from django.views.generic import DetailView, ListView, TemplateView, View
+
+from arq_admin import instrumentation, live, settings
+from arq_admin.bulk import (
+    BulkAction, BulkActionProgress, get_progress, start_bulk_action,
+)
+from arq_admin.connections import connection_manager
+from arq_admin.export import ExportFormat, export_jobs
+from arq_admin.forms import BulkActionForm, JobFilterForm
+from arq_admin.job import JobInfo, Preview
+from arq_admin.metrics import render_metrics
 from arq_admin.queue import Queue, QueueStats
 from arq_admin.settings import ARQ_QUEUES
 
 
-@method_decorator(staff_member_required, name='dispatch')
-class QueueListView(ListView):
+class AsyncAdminViewMixin:
+    # Views are async, so under ASGI they don't occupy a thread while waiting for Redis,
+    # and Django runs them with async_to_sync under WSGI.
+    # Redis work itself is awaited in the connection manager's loop where the pools live.
+
+    async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        # async version of the staff_member_required decorator, the user is loaded from the DB lazily
+        if not await sync_to_async(self.has_permission)(request):
+            return self.handle_no_permission(request)
+
+        if not settings.ARQ_DEBUG_FOOTER:
+            return await super().dispatch(request, *args, **kwargs)  # type: ignore
+
+        with instrumentation.profile() as profile:
+            response = await super().dispatch(request, *args, **kwargs)  # type: ignore
+
+        if isinstance(response, TemplateResponse):
+            response.context_data['arq_profile'] = profile
+        return response
+
+    def has_permission(self, request: HttpRequest) -> bool:
+        return self._is_staff_member(request)
+
+    def handle_no_permission(self, request: HttpRequest) -> HttpResponse:
+        return redirect_to_login(request.get_full_path(), reverse('admin:login'), REDIRECT_FIELD_NAME)
+
+    async def render_context(self, **kwargs: Any) -> HttpResponse:
+        # admin's context needs the DB as well
+        context = await sync_to_async(self.get_context_data)(**kwargs)  # type: ignore
+        return self.render_to_response(context)  # type: ignore
+
+    @staticmethod
+    def _is_staff_member(request: HttpRequest) -> bool:
+        return request.user.is_active and request.user.is_staff
+
+
+class QueueListView(AsyncAdminViewMixin, ListView):
     template_name = 'arq_admin/queues.html'
 
-    def get_queryset(self) -> List[QueueStats]:
-        result = asyncio.run(self._gather_queues())
-        return result  # pragma: nocover
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        self.object_list = await connection_manager.arun(self._gather_queues())
+        return await self.render_context()
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        context.update(admin.site.each_context(self.request))
+        context.update({
+            **admin.site.each_context(self.request),
+            'data_as_of': min(
+                (queue_stats.data_as_of for queue_stats in self.object_list if queue_stats.data_as_of), default=None,
+            ),
+        })
 
         return context
 
     @staticmethod
-    async def _get_queue_stats(queue_name: str) -> QueueStats:
-        async with Queue.from_name(queue_name) as queue:
-            return await queue.get_stats()
+    async def _gather_queues() -> List[QueueStats]:
+        return await Queue.gather_stats(ARQ_QUEUES.keys())
 
-    @classmethod
-    async def _gather_queues(cls) -> List[QueueStats]:
-        result = []  # pragma: no cover
-        for name in ARQ_QUEUES.keys():  # pragma: no cover
-            result.append(await cls._get_queue_stats(name))
-        return result
 
-
-@method_decorator(staff_member_required, name='dispatch')
-class BaseJobListView(ListView):
+class BaseJobListView(AsyncAdminViewMixin, ListView):
     paginate_by = 100
     template_name = 'arq_admin/jobs.html'
 
@@ -57,10 +102,24 @@ class BaseJobListView(ListView):
 
         return self.status.value.capitalize() if self.status else 'Unknown'
 
-    def get_queryset(self) -> List[JobInfo]:
-        queue_name = self.kwargs['queue_name']  # pragma: no cover
-        jobs = asyncio.run(self._get_queue_jobs(queue_name))
-        return sorted(jobs, key=attrgetter('enqueue_time'))  # pragma: nocover
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        self.filter_form = JobFilterForm(request.GET)
+        return await self.render_context(**await connection_manager.arun(self._get_page_context()))
+
+    async def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        # applies a bulk action to the selected jobs or to all the jobs matching the filter
+        self.filter_form = JobFilterForm(request.GET)
+        bulk_action_form = BulkActionForm(request.POST)
+        if not bulk_action_form.is_valid():
+            messages.error(request, 'Select an action and jobs to apply it to')
+            return redirect(request.get_full_path())
+
+        action_id = await connection_manager.arun(self._start_bulk_action(bulk_action_form.cleaned_data))
+        return redirect('arq_admin:bulk_action', queue_name=self.kwargs['queue_name'], action_id=action_id)
+
+    def get_paginate_by(self, queryset: Any) -> Optional[int]:
+        # the page is already paginated in get() before its jobs are fetched
+        return None
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -68,13 +127,48 @@ class BaseJobListView(ListView):
             **admin.site.each_context(self.request),
             'queue_name': self.kwargs['queue_name'],
             'job_status': self.job_status,
+            'page_range': context['paginator'].get_elided_page_range(context['page_obj'].number),
+            'filter_form': self.filter_form,
+            'bulk_action_form': BulkActionForm(),
+            'filter_query': self._get_filter_query(),
+            'export_query': self._get_export_query(),
         })
 
         return context
 
-    async def _get_queue_jobs(self, queue_name: str) -> List[JobInfo]:
-        async with Queue.from_name(queue_name) as queue:
-            return await queue.get_jobs(status=self.status)
+    def _get_filter_query(self) -> str:
+        # query string to keep the filter between pages
+        query = self.request.GET.copy()
+        query.pop(self.page_kwarg, None)
+        return query.urlencode()
+
+    def _get_export_query(self) -> str:
+        # the export gets the same jobs as the list
+        query = self.request.GET.copy()
+        query.pop(self.page_kwarg, None)
+        if self.status:
+            query['status'] = self.status.value
+        return query.urlencode()
+
+    async def _get_page_context(self) -> Dict[str, Any]:
+        # only ids are fetched for the whole queue, jobs themselves are fetched just for the current page
+        async with Queue.from_name(self.kwargs['queue_name']) as queue:
+            job_ids = await self._get_job_ids(queue)
+            paginator, page, page_job_ids, is_paginated = self.paginate_queryset(job_ids, self.paginate_by)
+            page.object_list = self.object_list = await queue.get_job_summaries_by_ids(page_job_ids)
+
+        return {'paginator': paginator, 'page_obj': page, 'is_paginated': is_paginated, 'data_as_of': queue.data_as_of}
+
+    async def _get_job_ids(self, queue: Queue) -> List[str]:
+        return await queue.get_job_ids(status=self.status, job_filter=self.filter_form.get_job_filter())
+
+    async def _start_bulk_action(self, cleaned_data: Dict[str, Any]) -> str:
+        job_ids = cleaned_data['job_ids']
+        if cleaned_data['select_all']:
+            async with Queue.from_name(self.kwargs['queue_name']) as queue:
+                job_ids = await self._get_job_ids(queue)
+
+        return await start_bulk_action(self.kwargs['queue_name'], BulkAction(cleaned_data['action']), job_ids)
 
 
 class AllJobListView(BaseJobListView):
@@ -93,15 +187,126 @@ class DeferredJobListView(BaseJobListView):
     status = JobStatus.deferred
 
 
-class JobDetailView(DetailView):
+class CompleteJobListView(BaseJobListView):
+    status = JobStatus.complete
+    failed = False
+
+    async def _get_job_ids(self, queue: Queue) -> List[str]:
+        return await queue.get_finished_job_ids(failed=self.failed, job_filter=self.filter_form.get_job_filter())
+
+
+class FailedJobListView(CompleteJobListView):
+    job_status_label = 'Failed'
+    failed = True
+
+    def _get_export_query(self) -> str:
+        query = self.request.GET.copy()
+        query.pop(self.page_kwarg, None)
+        query.update({'status': JobStatus.complete.value, 'success': 'false'})
+        return query.urlencode()
+
+
+class JobExportView(AsyncAdminViewMixin, View):
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> StreamingHttpResponse:
+        try:
+            export_format = ExportFormat(self.kwargs['export_format'])
+            status = JobStatus(request.GET['status']) if request.GET.get('status') else None
+        except ValueError:
+            raise Http404('Unknown export format or job status')
+
+        job_filter = JobFilterForm(request.GET).get_job_filter()
+        jobs = export_jobs(self.kwargs['queue_name'], export_format, status, job_filter)
+        response = StreamingHttpResponse(
+            _get_streaming_content(request, jobs), content_type=export_format.content_type,
+        )
+        filename = f'{self.kwargs["queue_name"]}-jobs.{export_format.value}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class LiveDashboardView(AsyncAdminViewMixin, TemplateView):
+    template_name = 'arq_admin/live.html'
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        return await self.render_context()
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context.update({
+            **admin.site.each_context(self.request),
+            'queue_names': list(ARQ_QUEUES.keys()),
+        })
+
+        return context
+
+
+class LiveEventsView(AsyncAdminViewMixin, View):
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> StreamingHttpResponse:
+        response = StreamingHttpResponse(
+            _get_streaming_content(request, live.subscribe(ARQ_QUEUES.keys())), content_type='text/event-stream',
+        )
+        response['Cache-Control'] = 'no-cache'
+        # nginx mustn't buffer the events
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+
+class BulkActionView(AsyncAdminViewMixin, TemplateView):
+    template_name = 'arq_admin/bulk_action.html'
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        progress = await connection_manager.arun(self._get_progress())
+        if progress is None:
+            raise Http404('Bulk action not found')
+
+        return await self.render_context(progress=progress)
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context.update({
+            **admin.site.each_context(self.request),
+            'queue_name': self.kwargs['queue_name'],
+        })
+
+        return context
+
+    async def _get_progress(self) -> Optional[BulkActionProgress]:
+        return await get_progress(self.kwargs['queue_name'], self.kwargs['action_id'])
+
+
+class MetricsView(AsyncAdminViewMixin, View):
+    def has_permission(self, request: HttpRequest) -> bool:
+        # scrapers can't log in, so they authenticate with a token if it's set
+        if settings.ARQ_METRICS_TOKEN:
+            expected_header = f'Bearer {settings.ARQ_METRICS_TOKEN}'
+            if hmac.compare_digest(request.headers.get('Authorization', ''), expected_header):
+                return True
+
+        return super().has_permission(request)
+
+    def handle_no_permission(self, request: HttpRequest) -> HttpResponse:
+        return HttpResponseForbidden('Staff member or metrics token required')
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        metrics = await connection_manager.arun(render_metrics(ARQ_QUEUES.keys()))
+        return HttpResponse(metrics, content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+class JobDetailView(AsyncAdminViewMixin, DetailView):
     template_name = 'arq_admin/job_detail.html'
 
-    def get_object(self, queryset: Optional[Any] = None) -> JobInfo:
-        return asyncio.run(self._get_job_info())
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        self.object = await connection_manager.arun(self._get_job_info())
+        return await self.render_context(object=self.object)
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context['queue_name'] = self.kwargs['queue_name']
+        # huge payloads are cut, so the page stays light
+        context['previews'] = {
+            name: Preview.from_value(getattr(self.object, name), settings.ARQ_PREVIEW_MAX_LENGTH)
+            for name in ('args', 'kwargs', 'result')
+        }
 
         return context
 
@@ -113,8 +318,8 @@ class JobDetailView(DetailView):
 class JobAbortView(JobDetailView):
     template_name = 'arq_admin/job_abort.html'
 
-    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:  # pragma: nocover
-        aborted = asyncio.run(self._abort_job())
+    async def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        aborted = await connection_manager.arun(self._abort_job())
         if aborted:
             messages.success(request, 'Job aborted successfully')
         elif aborted is None:
@@ -127,3 +332,11 @@ class JobAbortView(JobDetailView):
     async def _abort_job(self) -> Optional[bool]:
         async with Queue.from_name(self.kwargs['queue_name']) as queue:
             return await queue.abort_job(self.kwargs['job_id'])
+
+
+def _get_streaming_content(request: HttpRequest, chunks: AsyncGenerator[str, None]) -> Any:
+    # the chunks are generated in the connection manager's loop one by one while the response is being sent
+    if isinstance(request, ASGIRequest):
+        return connection_manager.aiterate(chunks)
+
+    return connection_manager.iterate(chunks)
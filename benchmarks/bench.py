@@ -0,0 +1,235 @@
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from arq import ArqRedis, create_pool
+from arq.connections import RedisSettings
+from arq.constants import (
+    in_progress_key_prefix, job_key_prefix, result_key_prefix,
+)
+from arq.jobs import JobStatus, serialize_job, serialize_result
+from arq.utils import timestamp_ms
+from django.conf import settings
+
+QUEUE_NAME = 'arq:benchmark'
+POPULATE_BATCH_SIZE = 10000
+JOB_STATUSES = [None, JobStatus.queued, JobStatus.in_progress, JobStatus.deferred, JobStatus.complete]
+LIST_VIEWS = ['all_jobs', 'queued_jobs', 'running_jobs', 'deferred_jobs', 'complete_jobs', 'failed_jobs']
+
+
+@dataclass
+class Measurement:
+    name: str
+    latencies: List[float]
+    redis_commands: int
+    redis_bytes_received: int
+    peak_memory: int
+
+    @property
+    def median_latency(self) -> float:
+        return statistics.median(self.latencies)
+
+    def render(self) -> str:
+        return (
+            f'{self.name:<32} {self.median_latency * 1000:>10.1f} {min(self.latencies) * 1000:>10.1f} '
+            f'{self.redis_commands:>8} {self.redis_bytes_received / 1024:>12.1f} '
+            f'{self.peak_memory / 1024 / 1024:>10.1f}'
+        )
+
+
+HEADER = f'{"case":<32} {"median ms":>10} {"min ms":>10} {"commands":>8} {"received KiB":>12} {"peak MiB":>10}'
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Measures the admin against a synthetic large queue')
+    parser.add_argument('--queued', type=int, default=10000, help='jobs waiting for a worker')
+    parser.add_argument('--deferred', type=int, default=10000, help='jobs deferred to the future')
+    parser.add_argument('--in-progress', type=int, default=1000, help='jobs being run by workers')
+    parser.add_argument('--results', type=int, default=10000, help='results of finished jobs, every tenth is failed')
+    parser.add_argument('--repeat', type=int, default=3, help='runs of every case')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=6379)
+    parser.add_argument(
+        '--database', type=int, default=15, help='Redis database to use, it is flushed before and after the run',
+    )
+    parser.add_argument('--use-scripts', action='store_true', help='set ARQ_USE_SCRIPTS')
+    parser.add_argument('--skip-views', action='store_true', help="don't measure rendering of the views")
+    parser.add_argument('--json', help='path to also save the measurements to as JSON')
+    return parser.parse_args(args)
+
+
+async def populate(redis: ArqRedis, queued: int, deferred: int, in_progress: int, results: int) -> None:
+    # jobs are written the same way arq writes them, but in big pipelines
+    now_ms = timestamp_ms()
+    await _populate_jobs(redis, 'queued', queued, now_ms - queued)
+    await _populate_jobs(redis, 'deferred', deferred, now_ms + 3600 * 1000)
+    await _populate_jobs(redis, 'in_progress', in_progress, now_ms - queued - in_progress)
+    await _populate_results(redis, results, now_ms)
+
+
+async def _populate_jobs(redis: ArqRedis, prefix: str, count: int, first_score: int) -> None:
+    for batch_start in range(0, count, POPULATE_BATCH_SIZE):
+        async with redis.pipeline(transaction=False) as pipe:
+            scores: Dict[str, int] = {}
+            for i in range(batch_start, min(batch_start + POPULATE_BATCH_SIZE, count)):
+                job_id = f'{prefix}_{i}'
+                scores[job_id] = first_score + i
+                pipe.set(job_key_prefix + job_id, serialize_job(f'{prefix}_task', (i,), {}, 1, scores[job_id]))
+                if prefix == 'in_progress':
+                    pipe.set(in_progress_key_prefix + job_id, b'1')
+            pipe.zadd(QUEUE_NAME, scores)
+            await pipe.execute()
+
+
+async def _populate_results(redis: ArqRedis, count: int, now_ms: int) -> None:
+    for batch_start in range(0, count, POPULATE_BATCH_SIZE):
+        async with redis.pipeline(transaction=False) as pipe:
+            for i in range(batch_start, min(batch_start + POPULATE_BATCH_SIZE, count)):
+                success = i % 10 != 0
+                raw_result = serialize_result(
+                    'finished_task', (i,), {}, 1, now_ms - 1000, success, 'result' if success else ValueError(i),
+                    now_ms - 500, now_ms - i, f'finished_{i}', QUEUE_NAME,
+                )
+                pipe.set(result_key_prefix + f'finished_{i}', raw_result)  # type: ignore
+            await pipe.execute()
+
+
+def measure(name: str, repeat: int, run: Callable[[], Any]) -> Measurement:
+    # arq_admin reads Django settings on import, so it's imported only after configure()
+    from arq_admin import instrumentation
+
+    latencies = []
+    for _ in range(repeat):
+        with instrumentation.profile() as profile:
+            started_at = time.perf_counter()
+            run()
+            latencies.append(time.perf_counter() - started_at)
+
+    # tracing allocations slows everything down, so the peak memory is measured in a separate run
+    tracemalloc.start()
+    try:
+        run()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(
+        name=name,
+        latencies=latencies,
+        # the first run may also fill the result index, so the commands of the last one are the usual ones
+        redis_commands=profile.redis_commands_count,
+        redis_bytes_received=profile.bytes_received,
+        peak_memory=peak_memory,
+    )
+
+
+def measure_queue(repeat: int) -> List[Measurement]:
+    from arq_admin.connections import connection_manager
+    from arq_admin.queue import Queue
+
+    def run_with_queue(get: Callable[[Queue], Awaitable[Any]]) -> Callable[[], Any]:
+        async def run() -> Any:
+            async with Queue.from_name(QUEUE_NAME) as queue:
+                return await get(queue)
+
+        return lambda: connection_manager.run(run())
+
+    def get_jobs(status: Optional[JobStatus]) -> Callable[[Queue], Awaitable[Any]]:
+        return lambda queue: queue.get_jobs(status)
+
+    measurements = [measure('get_stats', repeat, run_with_queue(lambda queue: queue.get_stats()))]
+    for status in JOB_STATUSES:
+        name = f'get_jobs({status.value if status else "all"})'
+        measurements.append(measure(name, repeat, run_with_queue(get_jobs(status))))
+    measurements.append(measure(
+        'get_job_by_id', repeat, run_with_queue(lambda queue: queue.get_job_by_id('queued_0')),
+    ))
+    return measurements
+
+
+def measure_views(repeat: int) -> List[Measurement]:
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import setup_test_environment
+    from django.urls import reverse
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+    client = Client()
+    client.force_login(User.objects.create_superuser('benchmark', 'benchmark@example.com', 'benchmark'))
+
+    def render(url: str) -> Callable[[], None]:
+        def run() -> None:
+            response = client.get(url)
+            assert response.status_code == 200, response.status_code
+
+        return run
+
+    urls = [(view, reverse(f'arq_admin:{view}', kwargs={'queue_name': QUEUE_NAME})) for view in LIST_VIEWS]
+    urls.insert(0, ('home', reverse('arq_admin:home')))
+    job_detail_url = reverse('arq_admin:job_detail', kwargs={'queue_name': QUEUE_NAME, 'job_id': 'queued_0'})
+    urls.append(('job_detail', job_detail_url))
+    return [measure(f'view {view}', repeat, render(url)) for view, url in urls]
+
+
+def configure(redis_settings: RedisSettings, use_scripts: bool) -> None:
+    import django
+
+    from tests import settings as test_settings
+
+    test_settings_values = {name: getattr(test_settings, name) for name in dir(test_settings) if name.isupper()}
+    test_settings_values.update({
+        'ARQ_QUEUES': {QUEUE_NAME: redis_settings},
+        'ARQ_USE_SCRIPTS': use_scripts,
+        'DATABASES': {'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        'DEBUG': False,
+    })
+    settings.configure(**test_settings_values)
+    django.setup()
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    options = parse_args(args)
+    redis_settings = RedisSettings(host=options.host, port=options.port, database=options.database)
+    configure(redis_settings, options.use_scripts)
+
+    async def prepare() -> None:
+        redis = await create_pool(redis_settings)
+        await redis.flushdb()
+        started_at = time.perf_counter()
+        await populate(redis, options.queued, options.deferred, options.in_progress, options.results)
+        print(f'populated in {time.perf_counter() - started_at:.1f}s', file=sys.stderr)
+        await redis.close()
+
+    async def clean_up() -> None:
+        redis = await create_pool(redis_settings)
+        await redis.flushdb()
+        await redis.close()
+
+    asyncio.run(prepare())
+    try:
+        measurements = measure_queue(options.repeat)
+        if not options.skip_views:
+            measurements.extend(measure_views(options.repeat))
+    finally:
+        asyncio.run(clean_up())
+
+    print(HEADER)
+    for measurement in measurements:
+        print(measurement.render())
+
+    if options.json:
+        with open(options.json, 'w') as json_file:
+            report = {'options': vars(options), 'measurements': [asdict(measurement) for measurement in measurements]}
+            json.dump(report, json_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
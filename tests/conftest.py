@@ -83,6 +83,13 @@ class JobsCreator:
 
         return job
 
+    async def create_failed(self) -> Job:
+        job = await self.redis.enqueue_job('failed_task', _job_id='failed_task')
+        assert job
+        await self.worker.main()
+
+        return job
+
     async def create_running(self) -> Optional[Job]:
         job = await self.redis.enqueue_job('running_task', _job_id='running_task')
         with suppress(asyncio.TimeoutError):
@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from arq.constants import default_queue_name
+from arq.jobs import Job, JobStatus
+from django.test import AsyncClient
+from django.urls import reverse
+
+from arq_admin.api import JSONEncoder, get_last_modified
+from arq_admin.job import JobCursor, JobInfo
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+async def test_queues(async_client: AsyncClient) -> None:
+    result = await async_client.get(reverse('arq_admin:api_queues'))
+
+    assert result.status_code == 200
+    queue = result.json()['queues'][0]
+    assert queue['name'] == default_queue_name
+    assert queue['queued_jobs'] == 1
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+async def test_requires_staff(async_client: AsyncClient) -> None:
+    result = await async_client.get(reverse('arq_admin:api_queues'))
+
+    assert result.status_code == 403
+    assert result.json() == {'error': 'Staff member required'}
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+async def test_jobs_with_cursor(async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:api_jobs', kwargs={'queue_name': default_queue_name})
+    jobs: List[Dict[str, Any]] = []
+    params = {'limit': '3'}
+    while True:
+        result = await async_client.get(url, params)
+        assert result.status_code == 200
+        jobs.extend(result.json()['jobs'])
+        if not result.json()['next_cursor']:
+            break
+        params['cursor'] = result.json()['next_cursor']
+
+    assert [job['job_id'] for job in jobs] == ['running_task', 'queued_task', 'deferred_task', 'finished_task']
+    assert jobs[-1]['result'] == 'success'
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+async def test_jobs_not_modified(async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:api_jobs', kwargs={'queue_name': default_queue_name})
+
+    result = await async_client.get(url, {'status': 'deferred'})
+    assert result.status_code == 200
+    assert result.headers['Last-Modified']
+
+    result = await async_client.get(url, {'status': 'deferred'}, headers={'If-None-Match': result.headers['ETag']})
+    assert result.status_code == 304
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login')
+@pytest.mark.parametrize('params', [{'status': 'unknown'}, {'cursor': 'broken'}, {'limit': 'many'}, {'limit': '0'}])
+async def test_jobs_with_invalid_params(async_client: AsyncClient, params: Dict[str, str]) -> None:
+    result = await async_client.get(reverse('arq_admin:api_jobs', kwargs={'queue_name': default_queue_name}), params)
+
+    assert result.status_code == 400
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+@pytest.mark.parametrize(('job_id', 'status_code'), [('finished_task', 200), ('missing_task', 404)])
+async def test_job_detail(async_client: AsyncClient, job_id: str, status_code: int) -> None:
+    url = reverse('arq_admin:api_job_detail', kwargs={'queue_name': default_queue_name, 'job_id': job_id})
+
+    result = await async_client.get(url)
+    assert result.status_code == status_code
+    if status_code == 200:
+        assert result.json()['status'] == 'complete'
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+@patch.object(Job, 'abort', new_callable=AsyncMock, return_value=True)
+async def test_job_abort(_mocked_abort: AsyncMock, async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:api_job_abort', kwargs={'queue_name': default_queue_name, 'job_id': 'queued_task'})
+
+    result = await async_client.post(url)
+    assert result.json() == {'aborted': True}
+
+
+def test_cursor_encoding() -> None:
+    cursor = JobCursor(phase=1, score=1.5, job_id='job')
+    assert JobCursor.decode(cursor.encode()) == cursor
+
+
+def test_json_encoder_falls_back_to_repr() -> None:
+    assert JSONEncoder().encode({'result': {1, 2}}) == '{"result": "{1, 2}"}'
+
+
+def test_last_modified_of_missing_job() -> None:
+    job = JobInfo(
+        function='', args=(), kwargs={}, job_try=0, enqueue_time=datetime.now(), score=None, job_id='missing_task',
+        status=JobStatus.not_found,
+    )
+    assert get_last_modified(job) is None
@@ -0,0 +1,49 @@
+import asyncio
+from typing import List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from arq.constants import default_queue_name
+from arq.jobs import Job
+
+from arq_admin.bulk import (
+    BulkAction, BulkActionProgress, get_progress, start_bulk_action,
+)
+from arq_admin.queue import Queue
+
+
+async def _wait_for_progress(action_id: str) -> BulkActionProgress:
+    while True:
+        progress = await get_progress(default_queue_name, action_id)
+        assert progress
+        if progress.finished:
+            return progress
+
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio()
+async def test_bulk_delete(all_jobs: List[Job]) -> None:
+    job_ids = [job.job_id for job in all_jobs if job.job_id != 'running_task']
+    action_id = await start_bulk_action(default_queue_name, BulkAction.delete, job_ids)
+
+    assert await _wait_for_progress(action_id) == BulkActionProgress(
+        action=BulkAction.delete, total=3, done=3, finished=True,
+    )
+    async with Queue.from_name(default_queue_name) as queue:
+        assert await queue.get_job_ids() == ['running_task']
+
+
+@pytest.mark.asyncio()
+@patch.object(Queue, 'abort_jobs', side_effect=ConnectionError('Redis is down'))
+async def test_bulk_action_error(_mocked_abort_jobs: AsyncMock) -> None:
+    action_id = await start_bulk_action(default_queue_name, BulkAction.abort, ['job'])
+
+    progress = await _wait_for_progress(action_id)
+    assert progress.error == 'Redis is down'
+    assert progress.percent == 0
+
+
+@pytest.mark.asyncio()
+async def test_missing_bulk_action() -> None:
+    assert await get_progress(default_queue_name, 'missing') is None
@@ -0,0 +1,96 @@
+from typing import Generator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from arq.constants import default_queue_name
+from arq.jobs import Job
+
+from arq_admin import cache
+from arq_admin.queue import Queue
+
+
+@pytest.fixture(autouse=True)
+def enabled_cache() -> Generator[None, None, None]:
+    cache.local_cache.clear()
+    with patch('arq_admin.settings.ARQ_CACHE_TTL', 60):
+        yield
+    cache.local_cache.clear()
+
+
+@pytest.mark.asyncio()
+async def test_local_cache_ttl() -> None:
+    await cache.local_cache.aset('key', 'value', timeout=60)
+    await cache.local_cache.aset('expired_key', 'value', timeout=-1)
+
+    assert await cache.local_cache.aget('key') == 'value'
+    assert await cache.local_cache.aget('expired_key', 'default') == 'default'
+
+
+@pytest.mark.asyncio()
+@patch('arq_admin.settings.ARQ_CACHE_MAX_SIZE', 2)
+async def test_local_cache_evicts_least_recently_used() -> None:
+    await cache.local_cache.aset('first', 1, timeout=60)
+    await cache.local_cache.aset('second', 2, timeout=60)
+    await cache.local_cache.aget('first')
+    await cache.local_cache.aset('third', 3, timeout=60)
+
+    assert await cache.local_cache.aget('first') == 1
+    assert await cache.local_cache.aget('second') is None
+    assert await cache.local_cache.aget('third') == 3
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize('alias', [None, 'default'])
+async def test_store_load_invalidate(alias: str) -> None:
+    with patch('arq_admin.settings.ARQ_CACHE_ALIAS', alias):
+        cached_at = await cache.store(default_queue_name, 'name', 'value')
+        assert await cache.load(default_queue_name, 'name') == (cached_at, 'value')
+
+        await cache.invalidate(default_queue_name)
+        assert await cache.load(default_queue_name, 'name') is None
+
+
+@pytest.mark.asyncio()
+@patch('arq_admin.settings.ARQ_CACHE_TTL', 0)
+async def test_disabled_cache() -> None:
+    assert await cache.store(default_queue_name, 'name', 'value') is None
+    assert await cache.load(default_queue_name, 'name') is None
+    await cache.invalidate(default_queue_name)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_queue_uses_cached_data() -> None:
+    async with Queue.from_name(default_queue_name) as queue:
+        stats = await queue.get_stats()
+        job_ids = await queue.get_job_ids()
+        jobs = await queue.get_jobs_by_ids(job_ids)
+    assert queue.data_as_of is None
+    assert stats.data_as_of is None
+
+    with patch.object(Queue, '_count_jobs') as mocked_count_jobs, patch.object(
+        Queue, '_scan_job_ids_to_prefixes',
+    ) as mocked_scan, patch.object(Queue, '_get_jobs_batch') as mocked_get_jobs_batch:
+        async with Queue.from_name(default_queue_name) as queue:
+            assert await queue.get_stats() == stats
+            assert await queue.get_job_ids() == job_ids
+            assert await queue.get_jobs_by_ids(job_ids) == jobs
+
+    mocked_count_jobs.assert_not_called()
+    mocked_scan.assert_not_called()
+    mocked_get_jobs_batch.assert_not_called()
+    assert queue.data_as_of is not None
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+@patch.object(Job, 'abort', new_callable=AsyncMock)
+async def test_abort_job_invalidates_cache(_mocked_abort: AsyncMock) -> None:
+    async with Queue.from_name(default_queue_name) as queue:
+        await queue.get_stats()
+        await queue.abort_job('queued_task')
+
+    async with Queue.from_name(default_queue_name) as queue:
+        await queue.get_stats()
+
+    assert queue.data_as_of is None
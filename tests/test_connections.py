@@ -0,0 +1,78 @@
+from typing import AsyncGenerator, Generator
+from unittest.mock import patch
+
+import pytest
+from arq import ArqRedis
+
+from arq_admin.connections import ConnectionManager
+from tests.settings import REDIS_SETTINGS
+
+
+@pytest.fixture()
+def manager() -> Generator[ConnectionManager, None, None]:
+    manager = ConnectionManager()
+    yield manager
+    manager.close()
+
+
+async def _acquire_and_release(manager: ConnectionManager) -> ArqRedis:
+    redis = await manager.acquire(REDIS_SETTINGS)
+    await redis.ping()
+    await manager.release(redis)
+    return redis
+
+
+def test_pool_is_reused_between_runs(manager: ConnectionManager) -> None:
+    assert manager.run(_acquire_and_release(manager)) is manager.run(_acquire_and_release(manager))
+
+
+def test_unhealthy_pool_is_recreated(manager: ConnectionManager) -> None:
+    redis = manager.run(_acquire_and_release(manager))
+
+    with patch('arq_admin.settings.ARQ_POOL_HEALTH_CHECK_INTERVAL', 0), patch.object(
+        redis, 'ping', side_effect=ConnectionError,
+    ):
+        assert manager.run(_acquire_and_release(manager)) is not redis
+
+
+def test_healthy_pool_is_checked(manager: ConnectionManager) -> None:
+    redis = manager.run(_acquire_and_release(manager))
+
+    with patch('arq_admin.settings.ARQ_POOL_HEALTH_CHECK_INTERVAL', 0):
+        assert manager.run(_acquire_and_release(manager)) is redis
+
+
+@pytest.mark.asyncio()
+async def test_pool_outside_of_admin_loop_is_not_shared(manager: ConnectionManager) -> None:
+    assert await _acquire_and_release(manager) is not await _acquire_and_release(manager)
+
+
+def test_close(manager: ConnectionManager) -> None:
+    manager.run(_acquire_and_release(manager))
+    loop = manager.loop
+
+    manager.close()
+    manager.close()
+
+    assert loop.is_closed()
+    assert manager.loop is not loop
+
+
+def test_iterate_closes_generator(manager: ConnectionManager) -> None:
+    closed = False
+
+    async def numbers() -> AsyncGenerator[int, None]:
+        nonlocal closed
+        try:
+            for number in range(10):
+                yield number
+        finally:
+            closed = True
+
+    assert list(manager.iterate(numbers())) == list(range(10))
+
+    iterator = manager.iterate(numbers())
+    assert next(iterator) == 0
+    closed = False
+    iterator.close()
+    assert closed
@@ -0,0 +1,43 @@
+import csv
+import io
+import json
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+from arq.constants import default_queue_name
+from arq.jobs import JobStatus
+
+from arq_admin.export import EXPORT_FIELDS, ExportFormat, export_jobs
+from arq_admin.job import JobFilter
+
+
+async def _export(export_format: ExportFormat, status: Optional[JobStatus]) -> str:
+    return ''.join([chunk async for chunk in export_jobs(default_queue_name, export_format, status, JobFilter())])
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_csv_export() -> None:
+    rows = list(csv.DictReader(io.StringIO(await _export(ExportFormat.csv, JobStatus.complete))))
+
+    assert len(rows) == 1
+    assert list(rows[0]) == list(EXPORT_FIELDS)
+    assert rows[0]['job_id'] == 'finished_task'
+    assert rows[0]['success'] == 'True'
+    assert rows[0]['result'] == "'success'"
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+@pytest.mark.parametrize('batch_size', [1, 100])
+async def test_ndjson_export(batch_size: int) -> None:
+    with patch('arq_admin.settings.ARQ_JOBS_BATCH_SIZE', batch_size):
+        lines = (await _export(ExportFormat.ndjson, None)).splitlines()
+    rows: List[Dict[str, Any]] = [json.loads(line) for line in lines]
+
+    assert sorted(row['job_id'] for row in rows) == ['deferred_task', 'finished_task', 'queued_task', 'running_task']
+    queued_row = next(row for row in rows if row['job_id'] == 'queued_task')
+    assert queued_row['status'] == 'queued'
+    assert queued_row['success'] is None
+    assert queued_row['args'] == []
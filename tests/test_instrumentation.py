@@ -0,0 +1,91 @@
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+from arq.constants import default_queue_name
+from django.template.response import TemplateResponse
+from django.test import AsyncClient
+from django.urls import reverse
+
+from arq_admin import instrumentation
+from arq_admin.connections import connection_manager
+from arq_admin.queue import Queue
+
+
+async def _get_jobs() -> None:
+    async with Queue.from_name(default_queue_name) as queue:
+        await queue.get_jobs_by_ids(['queued_task', 'deferred_task'])
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_profile_is_recorded_in_admin_loop() -> None:
+    with instrumentation.profile() as profile:
+        await connection_manager.arun(_get_jobs())
+
+    assert profile.redis_commands == {'PIPELINE': 1}
+    assert profile.bytes_sent > 0
+    assert profile.bytes_received > 0
+    assert profile.jobs_hydrated == 2
+
+    await connection_manager.arun(_get_jobs())
+    assert profile.jobs_hydrated == 2
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_signals() -> None:
+    commands: List[str] = []
+    hydrated_jobs: List[int] = []
+
+    def on_redis_command(command: str, **kwargs: Any) -> None:
+        commands.append(command)
+
+    def on_jobs_hydrated(jobs: int, **kwargs: Any) -> None:
+        hydrated_jobs.append(jobs)
+
+    instrumentation.redis_command_executed.connect(on_redis_command)
+    instrumentation.jobs_hydrated.connect(on_jobs_hydrated)
+    try:
+        await connection_manager.arun(_get_jobs())
+    finally:
+        instrumentation.redis_command_executed.disconnect(on_redis_command)
+        instrumentation.jobs_hydrated.disconnect(on_jobs_hydrated)
+
+    assert commands == ['PIPELINE']
+    assert hydrated_jobs == [2]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+@patch('arq_admin.settings.ARQ_DEBUG_FOOTER', True)
+async def test_debug_footer(async_client: AsyncClient) -> None:
+    result = await async_client.get(reverse('arq_admin:all_jobs', kwargs={'queue_name': default_queue_name}))
+
+    assert isinstance(result, TemplateResponse)
+    assert result.context_data['arq_profile'].jobs_hydrated == 4
+    assert b'Redis: ' in result.content
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+@patch('arq_admin.instrumentation.is_enabled', return_value=False)
+async def test_nothing_is_recorded_when_disabled(_mocked_is_enabled: Any) -> None:
+    with patch('arq_admin.instrumentation.record_redis_command') as mocked_record:
+        async with Queue.from_name(default_queue_name) as queue:
+            await queue.get_stats()
+            await queue.get_job_by_id('queued_task')
+
+    mocked_record.assert_not_called()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login')
+@patch('arq_admin.settings.ARQ_DEBUG_FOOTER', True)
+async def test_debug_footer_is_skipped_for_non_template_responses(async_client: AsyncClient) -> None:
+    result = await async_client.get(reverse('arq_admin:metrics'))
+
+    assert result.status_code == 200
+    assert not isinstance(result, TemplateResponse)
@@ -0,0 +1,113 @@
+import asyncio
+import json
+from contextlib import suppress
+from typing import AsyncGenerator
+from unittest.mock import patch
+
+import pytest
+from arq import ArqRedis
+from arq.constants import default_queue_name, in_progress_key_prefix
+from django.http import StreamingHttpResponse
+from django.test import AsyncClient
+from django.urls import reverse
+
+from arq_admin import live
+from arq_admin.live import KEEPALIVE, Event, QueuePoller, subscribe
+from tests.conftest import JobsCreator
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_poller_sends_only_changed_stats(redis: ArqRedis) -> None:
+    poller = QueuePoller(default_queue_name)
+
+    events = await poller.poll()
+    assert [event.name for event in events] == ['stats']
+    assert events[0].data['changes']['queued_jobs'] == 1
+    assert events[0].data['changes']['deferred_jobs'] == 1
+
+    assert await poller.poll() == []
+
+    await redis.enqueue_job('successful_task', _job_id='new_task')
+    assert await poller.poll() == [Event('stats', {'queue': default_queue_name, 'changes': {'queued_jobs': 2}})]
+
+
+@pytest.mark.asyncio()
+async def test_poller_reports_started_and_finished_jobs(redis: ArqRedis, jobs_creator: JobsCreator) -> None:
+    await jobs_creator.create_queued()
+    poller = QueuePoller(default_queue_name)
+    await poller.poll()
+
+    await redis.set(in_progress_key_prefix + 'queued_task', b'1')
+    await asyncio.sleep(0.01)
+    await jobs_creator.create_failed()
+
+    events = await poller.poll()
+    assert events[-1] == Event('jobs', {
+        'queue': default_queue_name,
+        'started': ['queued_task'],
+        'finished': [{'job_id': 'failed_task', 'success': False}],
+    })
+    assert [event.name for event in await poller.poll()] == []
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_subscribers_share_poller() -> None:
+    first_subscription = subscribe([default_queue_name])
+    second_subscription = subscribe([default_queue_name])
+
+    first_event = await first_subscription.__anext__()
+    second_event = await second_subscription.__anext__()
+    assert first_event.startswith('event: stats\n')
+    assert json.loads(second_event.splitlines()[1][len('data: '):])['changes']['queued_jobs'] == 1
+
+    poller = live._pollers[default_queue_name]
+    assert len(poller.subscribers) == 2
+    task = poller.task
+
+    await first_subscription.aclose()
+    assert poller.task is task
+    await second_subscription.aclose()
+    assert default_queue_name not in live._pollers
+    assert task is not None
+    with suppress(asyncio.CancelledError):
+        await task
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio()
+@patch('arq_admin.settings.ARQ_LIVE_KEEPALIVE_INTERVAL', 0.01)
+@patch.object(QueuePoller, 'poll', return_value=[])
+async def test_keepalive(_mocked_poll: object) -> None:
+    subscription = subscribe([default_queue_name])
+    try:
+        assert await subscription.__anext__() == KEEPALIVE
+    finally:
+        await subscription.aclose()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login')
+async def test_live_dashboard_view(async_client: AsyncClient) -> None:
+    result = await async_client.get(reverse('arq_admin:live'))
+
+    assert result.status_code == 200
+    assert result.context_data['queue_names'] == [default_queue_name]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login')
+async def test_live_events_view(async_client: AsyncClient) -> None:
+    async def events(_queue_names: object) -> AsyncGenerator[str, None]:
+        yield Event('stats', {'queue': default_queue_name, 'changes': {'queued_jobs': 1}}).render()
+
+    with patch('arq_admin.live.subscribe', events):
+        result = await async_client.get(reverse('arq_admin:live_events'))
+        assert isinstance(result, StreamingHttpResponse)
+        assert result['Content-Type'] == 'text/event-stream'
+        content = b''.join([chunk async for chunk in result.streaming_content])  # type: ignore
+
+    assert content == b'event: stats\ndata: {"queue": "arq:queue", "changes": {"queued_jobs": 1}}\n\n'
@@ -0,0 +1,114 @@
+from typing import Generator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from arq.constants import default_queue_name
+from django.test import AsyncClient, Client
+from django.urls import reverse
+
+from arq_admin.connections import ConnectionManager
+from arq_admin.metrics import (
+    Histogram, redis_command_duration, render_metrics, stats_cache,
+)
+from arq_admin.queue import Queue
+from tests.settings import REDIS_SETTINGS
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics() -> Generator[None, None, None]:
+    stats_cache.clear()
+    redis_command_duration.clear()
+    yield
+    stats_cache.clear()
+    redis_command_duration.clear()
+
+
+def test_histogram() -> None:
+    histogram = Histogram('duration_seconds', 'Duration', 'command', buckets=[0.1, 1])
+    histogram.observe(0.05, 'GET')
+    histogram.observe(0.5, 'GET')
+    histogram.observe(5, 'GET')
+    histogram.observe(0.5, 'S"ET')
+
+    assert histogram.render() == [
+        '# HELP duration_seconds Duration',
+        '# TYPE duration_seconds histogram',
+        'duration_seconds_bucket{command="GET",le="0.1"} 1',
+        'duration_seconds_bucket{command="GET",le="1"} 2',
+        'duration_seconds_bucket{command="GET",le="+Inf"} 3',
+        'duration_seconds_sum{command="GET"} 5.55',
+        'duration_seconds_count{command="GET"} 3',
+        'duration_seconds_bucket{command="S\\"ET",le="0.1"} 0',
+        'duration_seconds_bucket{command="S\\"ET",le="1"} 1',
+        'duration_seconds_bucket{command="S\\"ET",le="+Inf"} 1',
+        'duration_seconds_sum{command="S\\"ET"} 0.5',
+        'duration_seconds_count{command="S\\"ET"} 1',
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_redis_commands_are_timed() -> None:
+    manager = ConnectionManager()
+    redis = await manager.acquire(REDIS_SETTINGS)
+    try:
+        await redis.ping()
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.ping()
+            await pipe.execute()
+    finally:
+        await manager.release(redis)
+
+    metrics = '\n'.join(redis_command_duration.render())
+    assert 'arq_admin_redis_command_duration_seconds_count{command="PING"} 1' in metrics
+    assert 'arq_admin_redis_command_duration_seconds_count{command="PIPELINE"} 1' in metrics
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_render_metrics() -> None:
+    metrics = await render_metrics([default_queue_name])
+
+    assert f'arq_queue_up{{queue="{default_queue_name}"}} 1' in metrics
+    assert f'arq_queue_queued_jobs{{queue="{default_queue_name}"}} 1' in metrics
+    assert f'arq_queue_running_jobs{{queue="{default_queue_name}"}} 1' in metrics
+    assert f'arq_queue_oldest_queued_job_age_seconds{{queue="{default_queue_name}"}} ' in metrics
+
+
+@pytest.mark.asyncio()
+@patch.object(Queue, '_count_jobs', side_effect=Exception('test error'))
+async def test_render_metrics_with_error(_mocked_count_jobs: AsyncMock) -> None:
+    metrics = await render_metrics([default_queue_name])
+
+    assert f'arq_queue_up{{queue="{default_queue_name}"}} 0' in metrics
+    assert 'arq_queue_oldest_queued_job_age_seconds{' not in metrics
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_metrics_are_cached() -> None:
+    await render_metrics([default_queue_name])
+
+    with patch.object(Queue, 'gather_stats') as mocked_gather_stats:
+        await render_metrics([default_queue_name])
+
+    mocked_gather_stats.assert_not_called()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login')
+async def test_metrics_view(async_client: AsyncClient) -> None:
+    result = await async_client.get(reverse('arq_admin:metrics'))
+
+    assert result.status_code == 200
+    assert result['Content-Type'].startswith('text/plain; version=0.0.4')
+    assert b'# TYPE arq_queue_queued_jobs gauge' in result.content
+
+
+@pytest.mark.django_db()
+@patch('arq_admin.settings.ARQ_METRICS_TOKEN', 'token')
+@pytest.mark.parametrize(('authorization', 'status_code'), [('Bearer token', 200), ('Bearer wrong', 403), ('', 403)])
+def test_metrics_view_with_token(client: Client, authorization: str, status_code: int) -> None:
+    result = client.get(reverse('arq_admin:metrics'), HTTP_AUTHORIZATION=authorization)
+
+    assert result.status_code == status_code
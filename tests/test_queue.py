@@ -1,15 +1,21 @@
 import asyncio
+import pickle
 from dataclasses import dataclass
-from typing import AsyncGenerator, Optional
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime, timedelta, timezone
+from typing import AsyncGenerator, List, Optional
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
 from arq import ArqRedis
-from arq.constants import default_queue_name
-from arq.jobs import DeserializationError, Job, JobStatus, JobDef
+from arq.connections import RedisSettings
+from arq.constants import abort_jobs_ss, default_queue_name
+from arq.jobs import DeserializationError, Job, JobDef, JobStatus
+from arq.utils import ms_to_datetime
 from django.conf import settings
+from redis.exceptions import ResponseError
 
+from arq_admin.job import JobFilter, JobSummary
 from arq_admin.queue import Queue, QueueStats
 from tests.conftest import JobsCreator
 
@@ -36,6 +42,75 @@ async def test_status_filter(queue: Queue) -> None:
     assert len(await queue.get_jobs(JobStatus.complete)) == 1
 
 
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_get_job_ids(queue: Queue) -> None:
+    # finished job is not in the queue anymore, the rest are ordered by score
+    assert await queue.get_job_ids() == ['finished_task', 'running_task', 'queued_task', 'deferred_task']
+    assert await queue.get_job_ids(JobStatus.deferred) == ['deferred_task']
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+@patch('arq_admin.settings.ARQ_JOBS_BATCH_SIZE', 1)
+@pytest.mark.parametrize(('job_filter', 'expected_job_ids'), [
+    (JobFilter(), ['finished_task', 'running_task', 'queued_task', 'deferred_task']),
+    (JobFilter(function='successful_task'), ['finished_task', 'queued_task']),
+    (JobFilter(success=True), ['finished_task']),
+    (JobFilter(success=False), []),
+    (JobFilter(min_job_try=1), ['finished_task']),
+    (JobFilter(enqueued_after=datetime.now(timezone.utc) + timedelta(hours=1)), []),
+    (JobFilter(enqueued_after=datetime.now(timezone.utc) - timedelta(hours=1)), [
+        'finished_task', 'running_task', 'queued_task', 'deferred_task',
+    ]),
+    (JobFilter(enqueued_before=datetime.now(timezone.utc) - timedelta(hours=1)), []),
+])
+async def test_get_job_ids_with_filter(queue: Queue, job_filter: JobFilter, expected_job_ids: List[str]) -> None:
+    assert await queue.get_job_ids(job_filter=job_filter) == expected_job_ids
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs', 'unserializable_job')
+@patch('arq_admin.settings.ARQ_JOBS_BATCH_SIZE', 2)
+async def test_get_jobs_by_ids(queue: Queue) -> None:
+    job_ids = ['finished_task', 'running_task', 'deferred_task', 'queued_task', 'unserializable_task', 'missing_task']
+    jobs = await queue.get_jobs_by_ids(job_ids)
+
+    assert [job.job_id for job in jobs] == job_ids
+    assert [job.status for job in jobs] == [
+        JobStatus.complete, JobStatus.in_progress, JobStatus.deferred, JobStatus.queued, JobStatus.queued,
+        JobStatus.not_found,
+    ]
+    assert jobs[0].result == 'success'
+    assert jobs[2].score == await queue._redis.zscore(queue.name, 'deferred_task')
+    assert jobs[4].function == "Unknown, can't deserialize"
+    assert jobs[5].function == "Can't find job"
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_get_job_summaries_by_ids(queue: Queue) -> None:
+    job_ids = ['finished_task', 'queued_task', 'running_task']
+    jobs = await queue.get_jobs_by_ids(job_ids)
+    summaries = await queue.get_job_summaries_by_ids(job_ids)
+
+    assert summaries == [JobSummary.from_info(job) for job in jobs]
+    assert summaries[0].success
+    assert not hasattr(summaries[0], 'result')
+    assert not hasattr(summaries[0], '__dict__')
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_get_jobs_by_ids_with_custom_deserializer(queue: Queue) -> None:
+    deserializer = MagicMock(side_effect=pickle.loads)
+    with patch('arq_admin.settings.ARQ_DESERIALIZER_BY_QUEUE', {queue.name: deserializer}):
+        jobs = await queue.get_jobs_by_ids(['queued_task'])
+
+    assert jobs[0].function == 'successful_task'
+    deserializer.assert_called_once()
+
+
 @pytest.mark.asyncio()
 @pytest.mark.usefixtures('all_jobs')
 async def test_stats(queue: Queue) -> None:
@@ -47,9 +122,23 @@ async def test_stats(queue: Queue) -> None:
         queued_jobs=1,
         running_jobs=1,
         deferred_jobs=1,
+        results_stored=1,
+        oldest_queued_job_at=ANY,
     )
 
 
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+@pytest.mark.parametrize('use_scripts', [False, True])
+async def test_stats_oldest_queued_job(redis: ArqRedis, queue: Queue, use_scripts: bool) -> None:
+    queued_job_score = await redis.zscore(queue.name, 'queued_task')
+    with patch('arq_admin.settings.ARQ_USE_SCRIPTS', use_scripts):
+        assert (await queue.get_stats()).oldest_queued_job_at == ms_to_datetime(int(queued_job_score))
+
+        await redis.zrem(queue.name, 'queued_task')
+        assert (await queue.get_stats()).oldest_queued_job_at is None
+
+
 @pytest.mark.asyncio()
 @pytest.mark.usefixtures('all_jobs')
 async def test_stats_with_running_job_wo_zscore(redis: ArqRedis, queue: Queue) -> None:
@@ -63,6 +152,8 @@ async def test_stats_with_running_job_wo_zscore(redis: ArqRedis, queue: Queue) -
         queued_jobs=1,
         running_jobs=0,
         deferred_jobs=1,
+        results_stored=1,
+        oldest_queued_job_at=ANY,
     )
 
 
@@ -79,11 +170,64 @@ async def test_stats_job_with_colon_in_the_name(redis: ArqRedis, queue: Queue) -
         queued_jobs=2,
         running_jobs=1,
         deferred_jobs=1,
+        results_stored=1,
+        oldest_queued_job_at=ANY,
     )
 
 
 @pytest.mark.asyncio()
-@patch.object(Queue, '_get_job_id_to_status_map')
+@pytest.mark.usefixtures('all_jobs')
+@pytest.mark.parametrize(('use_scan', 'scan_count', 'use_scripts'), [
+    (True, 1, False), (True, 1000, False), (False, 1000, False), (True, 1, True), (False, 1000, True),
+])
+async def test_status_map_discovery_modes(queue: Queue, use_scan: bool, scan_count: int, use_scripts: bool) -> None:
+    with patch('arq_admin.settings.ARQ_USE_SCAN', use_scan), patch(
+        'arq_admin.settings.ARQ_SCAN_COUNT', scan_count,
+    ), patch('arq_admin.settings.ARQ_USE_SCRIPTS', use_scripts):
+        assert await queue._get_job_id_to_status_map() == {
+            'finished_task': JobStatus.complete,
+            'running_task': JobStatus.in_progress,
+            'deferred_task': JobStatus.deferred,
+            'queued_task': JobStatus.queued,
+        }
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+@patch('arq_admin.settings.ARQ_USE_SCRIPTS', True)
+async def test_scripts(redis: ArqRedis, queue: Queue) -> None:
+    # a job without any keys left isn't listed
+    await redis.zadd(queue.name, {'lost_task': 1})
+    async with Queue.from_name(default_queue_name) as queue_without_scripts:
+        with patch('arq_admin.settings.ARQ_USE_SCRIPTS', False):
+            expected_stats = await queue_without_scripts.get_stats()
+
+    assert await queue.get_stats() == expected_stats
+    assert await queue.get_job_ids() == ['finished_task', 'running_task', 'queued_task', 'deferred_task']
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+@patch('arq_admin.settings.ARQ_USE_SCRIPTS', True)
+@patch('arq_admin.scripts.count_jobs', side_effect=ResponseError('unknown command'))
+@patch('arq_admin.scripts.classify_jobs', side_effect=ResponseError('unknown command'))
+async def test_scripts_fallback(mocked_classify_jobs: AsyncMock, mocked_count_jobs: AsyncMock, queue: Queue) -> None:
+    assert (await queue.get_stats()).running_jobs == 1
+    assert await queue.get_job_ids(JobStatus.queued) == ['queued_task']
+
+    mocked_count_jobs.assert_called_once()
+    mocked_classify_jobs.assert_called_once()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+@patch('arq_admin.settings.ARQ_USE_SCAN', False)
+async def test_stats_without_scan(queue: Queue) -> None:
+    assert (await queue.get_stats()).results_stored == 1
+
+
+@pytest.mark.asyncio()
+@patch.object(Queue, '_count_jobs')
 async def test_stats_with_error(mocked_get_job_ids: AsyncMock, queue: Queue) -> None:
     error_text = 'test error'
     mocked_get_job_ids.side_effect = Exception(error_text)
@@ -96,6 +240,50 @@ async def test_stats_with_error(mocked_get_job_ids: AsyncMock, queue: Queue) ->
     )
 
 
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_gather_stats_shares_results_scan(redis: ArqRedis) -> None:
+    second_queue_name = 'arq:queue2'
+    await redis.enqueue_job('successful_task', _job_id='second_queue_task', _queue_name=second_queue_name)
+
+    with patch.dict('arq_admin.settings.ARQ_QUEUES', {second_queue_name: settings.REDIS_SETTINGS}), patch.object(
+        Queue, '_count_results', autospec=True, side_effect=Queue._count_results,
+    ) as mocked_scan:
+        stats = await Queue.gather_stats([default_queue_name, second_queue_name])
+
+    mocked_scan.assert_called_once()
+    assert [(queue_stats.name, queue_stats.queued_jobs) for queue_stats in stats] == [
+        (default_queue_name, 1), (second_queue_name, 1),
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_gather_stats_with_unreachable_queue() -> None:
+    unreachable_queue_name = 'arq:unreachable'
+    unreachable_settings = RedisSettings(port=1, conn_retries=0)
+
+    with patch.dict('arq_admin.settings.ARQ_QUEUES', {unreachable_queue_name: unreachable_settings}):
+        stats = await Queue.gather_stats([default_queue_name, unreachable_queue_name])
+
+    assert stats[0].error is None
+    assert stats[0].queued_jobs == 0
+    assert stats[1].error
+    assert stats[1].queued_jobs is None
+
+
+@pytest.mark.asyncio()
+@patch('arq_admin.settings.ARQ_QUEUE_STATS_TIMEOUT', 0.01)
+async def test_gather_stats_timeout() -> None:
+    async def slow_get_stats(_queue: Queue) -> QueueStats:
+        await asyncio.sleep(1)
+        raise AssertionError  # pragma: nocover
+
+    with patch.object(Queue, 'get_stats', slow_get_stats):
+        stats = await Queue.gather_stats([default_queue_name])
+
+    assert stats[0].error == 'Timed out after 0.01 seconds'
+
+
 @pytest.mark.asyncio()
 @patch.object(Job, 'info')
 async def test_deserialize_error(mocked_job_info: MagicMock, jobs_creator: JobsCreator, queue: Queue) -> None:
@@ -137,3 +325,82 @@ async def test_abort_job_timeout(mocked_abort: AsyncMock, jobs_creator: JobsCrea
     mocked_abort.side_effect = asyncio.TimeoutError
     job = await jobs_creator.create_queued()
     assert await queue.abort_job(job.job_id) is None
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_abort_jobs(redis: ArqRedis, queue: Queue) -> None:
+    await queue.abort_jobs([])
+    await queue.abort_jobs(['queued_task', 'deferred_task'])
+
+    assert await redis.zrange(abort_jobs_ss, 0, -1) == [b'deferred_task', b'queued_task']
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_delete_jobs(queue: Queue) -> None:
+    await queue.delete_jobs([])
+    await queue.delete_jobs(['finished_task', 'queued_task', 'deferred_task'])
+
+    assert await queue.get_job_ids() == ['running_task']
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+@patch('arq_admin.settings.ARQ_JOBS_BATCH_SIZE', 1)
+@pytest.mark.parametrize(('status', 'job_filter', 'expected_job_ids'), [
+    (None, None, ['deferred_task', 'finished_task', 'queued_task', 'running_task']),
+    (JobStatus.complete, None, ['finished_task']),
+    (JobStatus.queued, None, ['queued_task']),
+    (None, JobFilter(function='successful_task'), ['finished_task', 'queued_task']),
+])
+async def test_iter_jobs(
+    queue: Queue, status: Optional[JobStatus], job_filter: Optional[JobFilter], expected_job_ids: List[str],
+) -> None:
+    assert sorted([job.job_id async for job in queue.iter_jobs(status, job_filter)]) == expected_job_ids
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+@pytest.mark.parametrize(('status', 'expected_job_ids'), [
+    (None, ['running_task', 'queued_task', 'deferred_task', 'finished_task']),
+    (JobStatus.deferred, ['deferred_task']),
+    (JobStatus.queued, ['queued_task']),
+    (JobStatus.complete, ['finished_task']),
+])
+async def test_get_jobs_page(queue: Queue, status: Optional[JobStatus], expected_job_ids: List[str]) -> None:
+    job_ids: List[str] = []
+    jobs, cursor = await queue.get_jobs_page(status, limit=1)
+    job_ids.extend(job.job_id for job in jobs)
+    while cursor:
+        jobs, cursor = await queue.get_jobs_page(status, cursor, limit=1)
+        job_ids.extend(job.job_id for job in jobs)
+
+    assert job_ids == expected_job_ids
+
+
+@pytest.mark.asyncio()
+async def test_get_jobs_page_with_same_scores(redis: ArqRedis, queue: Queue) -> None:
+    await redis.zadd(queue.name, {f'job_{i}': 1 for i in range(5)})
+
+    jobs, cursor = await queue.get_jobs_page(JobStatus.queued, limit=2)
+    assert [job.job_id for job in jobs] == ['job_0', 'job_1']
+
+    await redis.zrem(queue.name, 'job_1')
+    jobs, cursor = await queue.get_jobs_page(JobStatus.queued, cursor, limit=2)
+    assert [job.job_id for job in jobs] == ['job_2', 'job_3']
+
+    jobs, cursor = await queue.get_jobs_page(JobStatus.queued, cursor, limit=2)
+    assert [job.job_id for job in jobs] == ['job_4']
+    assert cursor is None
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('all_jobs')
+async def test_get_job_by_id_uses_status_map(queue: Queue) -> None:
+    await queue.get_job_ids(JobStatus.deferred)
+
+    with patch.object(Job, 'status') as mocked_status:
+        assert (await queue.get_job_by_id('queued_task')).status == JobStatus.queued
+
+    mocked_status.assert_not_called()
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+import pytest
+from arq import ArqRedis
+from arq.constants import default_queue_name, result_key_prefix
+from arq.jobs import deserialize_result
+
+from arq_admin.job import JobFilter
+from arq_admin.queue import Queue
+from arq_admin.results import (
+    ALL_RESULTS_KEY, REFRESH_LOCK_KEY_PREFIX, ResultIndex,
+)
+from tests.conftest import JobsCreator
+
+
+@pytest.mark.asyncio()
+async def test_finished_job_ids(jobs_creator: JobsCreator) -> None:
+    await jobs_creator.create_finished()
+    await jobs_creator.create_failed()
+    await jobs_creator.create_queued()
+
+    async with Queue.from_name(default_queue_name) as queue:
+        assert await queue.get_finished_job_ids() == ['failed_task', 'finished_task']
+        assert await queue.get_finished_job_ids(failed=True) == ['failed_task']
+
+
+@pytest.mark.asyncio()
+async def test_index_is_refreshed_once_in_interval(redis: ArqRedis, jobs_creator: JobsCreator) -> None:
+    await jobs_creator.create_finished()
+    result_index = ResultIndex(redis=redis, queue_name=default_queue_name)
+    assert await result_index.get_job_ids() == ['finished_task']
+
+    await jobs_creator.create_failed()
+    assert await result_index.get_job_ids() == ['finished_task']
+
+
+@pytest.mark.asyncio()
+@patch('arq_admin.settings.ARQ_JOBS_BATCH_SIZE', 1)
+async def test_index_is_incremental(redis: ArqRedis, jobs_creator: JobsCreator) -> None:
+    await jobs_creator.create_finished()
+    result_index = ResultIndex(redis=redis, queue_name=default_queue_name)
+    await result_index.refresh()
+
+    await jobs_creator.create_failed()
+    await redis.delete(REFRESH_LOCK_KEY_PREFIX + default_queue_name, result_key_prefix + 'finished_task')
+    await redis.set(result_key_prefix + 'unserializable_task', 'RANDOM TEXT')
+    with patch('arq_admin.results.deserialize_result', wraps=deserialize_result) as mocked_deserialize:
+        assert await result_index.get_job_ids() == ['failed_task']
+
+    assert mocked_deserialize.call_count == 2
+    assert await redis.zrange(ALL_RESULTS_KEY, 0, -1) == [b'unserializable_task', b'failed_task']
+
+
+@pytest.mark.asyncio()
+async def test_finished_job_ids_with_filter(jobs_creator: JobsCreator) -> None:
+    await jobs_creator.create_finished()
+    await jobs_creator.create_failed()
+
+    async with Queue.from_name(default_queue_name) as queue:
+        assert await queue.get_finished_job_ids(job_filter=JobFilter(success=True)) == ['finished_task']
+
+
+@pytest.mark.asyncio()
+async def test_index_skips_indexed_and_expired_results(redis: ArqRedis, jobs_creator: JobsCreator) -> None:
+    await jobs_creator.create_finished()
+    result_index = ResultIndex(redis=redis, queue_name=default_queue_name)
+    await result_index.refresh()
+
+    with patch.object(redis, 'mget') as mocked_mget:
+        await result_index._index(['finished_task'])
+    mocked_mget.assert_not_called()
+
+    await result_index._index(['expired_task'])
+    assert await redis.zscore(ALL_RESULTS_KEY, 'expired_task') is None
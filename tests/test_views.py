@@ -1,15 +1,21 @@
+import asyncio
+import json
+from typing import Any, Dict, List
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from arq import ArqRedis
 from arq.constants import default_queue_name, job_key_prefix
 from django.contrib.messages import get_messages
-from django.http import HttpResponseRedirect
+from django.http import HttpResponseRedirect, StreamingHttpResponse
 from django.template.response import TemplateResponse
-from django.test import AsyncClient, override_settings
+from django.test import AsyncClient, Client, override_settings
 from django.urls import reverse
 
+from arq_admin import cache
 from arq_admin.queue import Queue
+from arq_admin.views import BaseJobListView
+from tests.conftest import JobsCreator
 from tests.settings import REDIS_SETTINGS
 
 
@@ -23,6 +29,46 @@ async def test_queues_view(async_client: AsyncClient) -> None:
     assert len(result.context_data['object_list']) == 1
 
 
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+@patch('arq_admin.settings.ARQ_CACHE_TTL', 60)
+@pytest.mark.parametrize('url_name', ['arq_admin:home', 'arq_admin:all_jobs'])
+async def test_views_show_cached_data_time(async_client: AsyncClient, url_name: str) -> None:
+    cache.local_cache.clear()
+    kwargs = {'queue_name': default_queue_name} if url_name != 'arq_admin:home' else {}
+    url = reverse(url_name, kwargs=kwargs)
+
+    result = await async_client.get(url)
+    assert isinstance(result, TemplateResponse)
+    assert result.context_data['data_as_of'] is None
+
+    result = await async_client.get(url)
+    assert isinstance(result, TemplateResponse)
+    assert result.context_data['data_as_of'] is not None
+    assert b'Data as of' in result.content
+    cache.local_cache.clear()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+async def test_queues_view_requires_staff(async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:home')
+    result = await async_client.get(url)
+    assert isinstance(result, HttpResponseRedirect)
+    assert result.url == f'{reverse("admin:login")}?next={url}'
+
+
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('all_jobs')
+def test_all_queue_jobs_view_under_wsgi(admin_client: Client) -> None:
+    url = reverse('arq_admin:all_jobs', kwargs={'queue_name': default_queue_name})
+
+    result = admin_client.get(url)
+    assert isinstance(result, TemplateResponse)
+    assert len(result.context_data['object_list']) == 4
+
+
 @pytest.mark.asyncio()
 @pytest.mark.django_db()
 @pytest.mark.usefixtures('django_login', 'all_jobs')
@@ -45,6 +91,45 @@ async def test_all_queue_jobs_view_with_unserializable(async_client: AsyncClient
     assert len(result.context_data['object_list']) == 5
 
 
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@patch.object(BaseJobListView, 'paginate_by', 3)
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+async def test_all_queue_jobs_view_pagination(async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:all_jobs', kwargs={'queue_name': default_queue_name})
+
+    result = await async_client.get(url, {'page': 2})
+    assert isinstance(result, TemplateResponse)
+    assert result.context_data['paginator'].count == 4
+    assert [job.job_id for job in result.context_data['object_list']] == ['deferred_task']
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@patch.object(BaseJobListView, 'paginate_by', 1)
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+async def test_all_queue_jobs_view_with_filter(async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:all_jobs', kwargs={'queue_name': default_queue_name})
+
+    result = await async_client.get(url, {'function': 'successful_task', 'page': 2})
+    assert isinstance(result, TemplateResponse)
+    assert result.context_data['paginator'].count == 2
+    assert result.context_data['filter_query'] == 'function=successful_task'
+    assert [job.job_id for job in result.context_data['object_list']] == ['queued_task']
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+async def test_all_queue_jobs_view_with_invalid_filter(async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:all_jobs', kwargs={'queue_name': default_queue_name})
+
+    result = await async_client.get(url, {'min_job_try': 'many'})
+    assert isinstance(result, TemplateResponse)
+    assert result.context_data['filter_form'].errors
+    assert len(result.context_data['object_list']) == 4
+
+
 @pytest.mark.asyncio()
 @pytest.mark.django_db()
 @pytest.mark.usefixtures('django_login', 'all_jobs')
@@ -81,6 +166,21 @@ async def test_job_detail_view(redis: ArqRedis, async_client: AsyncClient) -> No
     assert result.context_data['object'].job_id == job_id
 
 
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+@patch('arq_admin.settings.ARQ_PREVIEW_MAX_LENGTH', 3)
+async def test_job_detail_view_truncates_payloads(async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:job_detail', kwargs={'queue_name': default_queue_name, 'job_id': 'finished_task'})
+
+    result = await async_client.get(url)
+    assert isinstance(result, TemplateResponse)
+    assert result.context_data['previews']['result'].text == 'suc'
+    assert b'suc&hellip; <i>(truncated, 7 characters in total)</i>' in result.content
+    assert result.context_data['previews']['args'].text == '()'
+    assert not result.context_data['previews']['args'].is_truncated
+
+
 @pytest.mark.asyncio()
 @pytest.mark.django_db()
 @pytest.mark.usefixtures('django_login', 'all_jobs')
@@ -137,8 +237,9 @@ async def test_post_job_abort_view(
 })
 async def test_two_queues_detail_views(async_client: AsyncClient, redis: ArqRedis) -> None:
     second_queue_name = 'arq:queue2'
-    import arq_admin.settings as arq_admin_settings
     from django.conf import settings as django_settings
+
+    import arq_admin.settings as arq_admin_settings
     arq_admin_settings.ARQ_QUEUES = django_settings.ARQ_QUEUES
 
     await redis.enqueue_job('successful_task', _job_id='job1', _queue_name=default_queue_name)
@@ -157,3 +258,107 @@ async def test_two_queues_detail_views(async_client: AsyncClient, redis: ArqRedi
     assert isinstance(result2, TemplateResponse)
     assert len(result2.context_data['object_list']) == 1
     assert result2.context_data['object_list'][0].job_id == 'job2'
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login')
+@pytest.mark.parametrize(('url_name', 'job_status', 'expected_job_ids'), [
+    ('arq_admin:complete_jobs', 'Complete', ['failed_task', 'finished_task']),
+    ('arq_admin:failed_jobs', 'Failed', ['failed_task']),
+])
+async def test_finished_jobs_views(
+    async_client: AsyncClient, jobs_creator: JobsCreator, url_name: str, job_status: str, expected_job_ids: List[str],
+) -> None:
+    await jobs_creator.create_finished()
+    await jobs_creator.create_failed()
+    url = reverse(url_name, kwargs={'queue_name': default_queue_name})
+
+    result = await async_client.get(url)
+    assert isinstance(result, TemplateResponse)
+    assert result.context_data['job_status'] == job_status
+    assert [job.job_id for job in result.context_data['object_list']] == expected_job_ids
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+@pytest.mark.parametrize(('data', 'expected_job_ids'), [
+    ({'action': 'delete', 'job_ids': ['queued_task', 'finished_task']}, ['running_task', 'deferred_task']),
+    ({'action': 'delete', 'select_all': 'on'}, ['finished_task', 'running_task', 'queued_task']),
+])
+async def test_bulk_action(async_client: AsyncClient, data: Dict[str, Any], expected_job_ids: List[str]) -> None:
+    url = reverse('arq_admin:all_jobs', kwargs={'queue_name': default_queue_name})
+
+    result = await async_client.post(url + '?function=deferred_task', data)
+    assert isinstance(result, HttpResponseRedirect)
+    action_url = result.url
+
+    while True:
+        result = await async_client.get(action_url)
+        assert isinstance(result, TemplateResponse)
+        if result.context_data['progress'].finished:
+            break
+        await asyncio.sleep(0.01)
+
+    async with Queue.from_name(default_queue_name) as queue:
+        assert sorted(await queue.get_job_ids()) == sorted(expected_job_ids)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login')
+async def test_bulk_action_without_jobs(async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:all_jobs', kwargs={'queue_name': default_queue_name})
+
+    result = await async_client.post(url, {'action': 'abort'})
+    assert isinstance(result, HttpResponseRedirect)
+    assert result.url == url
+    assert [str(message) for message in get_messages(result.asgi_request)] == [
+        'Select an action and jobs to apply it to',
+    ]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login')
+async def test_missing_bulk_action_view(async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:bulk_action', kwargs={'queue_name': default_queue_name, 'action_id': 'missing'})
+
+    result = await async_client.get(url)
+    assert result.status_code == 404
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login', 'all_jobs')
+async def test_export_view(async_client: AsyncClient) -> None:
+    url = reverse('arq_admin:export_jobs', kwargs={'queue_name': default_queue_name, 'export_format': 'ndjson'})
+
+    result = await async_client.get(url, {'status': 'queued', 'function': 'successful_task'})
+    assert isinstance(result, StreamingHttpResponse)
+    assert result['Content-Type'] == 'application/x-ndjson'
+    content = b''.join([chunk async for chunk in result.streaming_content])  # type: ignore
+    assert [json.loads(line)['job_id'] for line in content.splitlines()] == ['queued_task']
+
+
+@pytest.mark.usefixtures('all_jobs')
+def test_export_view_under_wsgi(admin_client: Client) -> None:
+    url = reverse('arq_admin:export_jobs', kwargs={'queue_name': default_queue_name, 'export_format': 'csv'})
+
+    result = admin_client.get(url)
+    assert isinstance(result, StreamingHttpResponse)
+    lines = b''.join(result.streaming_content).decode('utf-8').splitlines()  # type: ignore
+    assert lines[0].startswith('job_id,function,')
+    assert len(lines) == 5
+
+
+@pytest.mark.asyncio()
+@pytest.mark.django_db()
+@pytest.mark.usefixtures('django_login')
+@pytest.mark.parametrize(('export_format', 'status'), [('xml', ''), ('csv', 'unknown')])
+async def test_export_view_not_found(async_client: AsyncClient, export_format: str, status: str) -> None:
+    url = reverse('arq_admin:export_jobs', kwargs={'queue_name': default_queue_name, 'export_format': export_format})
+
+    result = await async_client.get(url, {'status': status})
+    assert result.status_code == 404